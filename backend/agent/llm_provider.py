@@ -10,7 +10,7 @@ from typing import Any, Callable, Dict, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import BaseModel
 
-from ..llm import get_async_client
+from ..llm import _dumps_json, get_async_client
 
 try:
   from google import genai  # type: ignore
@@ -478,7 +478,7 @@ async def run_structured_completion(
   if verbosity is None:
     verbosity = _get_openai_verbosity()
   provider = _provider_for_model(model)
-  user_content = json.dumps(user_payload, ensure_ascii=False)
+  user_content = _dumps_json(user_payload)
 
   if provider == "gemini":
     client, unavailable_reason = _gemini_client_or_reason()
@@ -597,7 +597,7 @@ async def run_text_completion(
   if verbosity is None:
     verbosity = _get_openai_verbosity()
   provider = _provider_for_model(model)
-  user_content = json.dumps(user_payload, ensure_ascii=False)
+  user_content = _dumps_json(user_payload)
 
   if provider == "gemini":
     client, unavailable_reason = _gemini_client_or_reason()
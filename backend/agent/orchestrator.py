@@ -30,19 +30,19 @@ from .slot_extractor import (extract_step_args,
                              validate_and_enrich_plan_with_context_decision)
 from .state import (clear_pending_clarification, get_pending_clarification,
                     get_preferences, set_pending_clarification)
-from ..recurrence import _expand_recurring_item
+from ..recurrence import _iter_recurring_item
 from ..gcal import (
     fetch_google_events_between,
     fetch_google_tasks,
     sync_google_event_after_write,
+    sync_google_events_after_write,
     sync_google_event_after_delete,
     emit_google_sync,
-    gcal_create_single_event,
-    gcal_create_recurring_event,
     gcal_delete_event,
     gcal_update_event,
     get_google_tasks_service,
     gcal_batch_insert_events,
+    gcal_insert_event_body,
     gcal_batch_update_events,
     gcal_batch_delete_events,
     gcal_batch_insert_tasks,
@@ -196,6 +196,8 @@ _MUTATION_INTENTS = {
 }
 
 _TASK_BATCH_CHUNK_SIZE = 50
+_CREATE_ITEM_META_KEYS = ("title", "start", "end", "start_date", "time", "duration_minutes",
+                          "recurrence", "rrule", "all_day")
 _SLOT_EXTRACTOR_CLARIFY_CONFIDENCE_THRESHOLD = 0.7
 
 
@@ -769,13 +771,9 @@ def _expand_task_recurring_item(item: Dict[str, Any],
       "rrule": item.get("rrule"),
       "timezone": item_timezone,
   }
-  expanded = _expand_recurring_item(recurring_item)
-  if not expanded:
-    return []
-
   notes = item.get("notes")
   out: List[Dict[str, Any]] = []
-  for occ in expanded:
+  for occ in _iter_recurring_item(recurring_item):
     if not isinstance(occ, dict):
       continue
     start_iso = occ.get("start")
@@ -873,49 +871,16 @@ def _execute_step(step: PlanStep, session_id: str, timezone_name: str,
         raise HTTPException(status_code=502,
                             detail=f"Failed to build event body at items[{index}].")
       bodies.append(body)
-      item_metas.append({
-          "type": item_type,
-          "title": item.get("title"),
-          "start": item.get("start"),
-          "end": item.get("end"),
-          "start_date": item.get("start_date"),
-          "time": item.get("time"),
-          "duration_minutes": item.get("duration_minutes"),
-          "recurrence": item.get("recurrence"),
-          "rrule": item.get("rrule"),
-          "all_day": item.get("all_day"),
-      })
+      # recurrence/rrule은 body 생성 중 정규화된 값을 담도록 body 다음에 읽는다.
+      item_meta = {"type": item_type}
+      item_meta.update((key, item.get(key)) for key in _CREATE_ITEM_META_KEYS)
+      item_metas.append(item_meta)
 
-    # Single item: direct call (no batch overhead)
+    # Single item: direct call (no batch overhead). The body built above is
+    # inserted as-is instead of being rebuilt from the item.
     if len(bodies) == 1:
-      item = dict(create_items[0])
       item_type = item_metas[0]["type"]
-      item_timezone = item.get("timezone") or args.get("timezone") or timezone_name
-      event_id: Optional[str] = None
-      if item_type == "single":
-        all_day_value = item.get("all_day")
-        if all_day_value is not None:
-          all_day_value = bool(all_day_value)
-        event_id = gcal_create_single_event(
-            title=item.get("title"),
-            start_iso=item.get("start"),
-            end_iso=item.get("end"),
-            location=item.get("location"),
-            all_day=all_day_value,
-            session_id=session_id,
-            description=item.get("description"),
-            attendees=item.get("attendees"),
-            reminders=item.get("reminders"),
-            visibility=item.get("visibility"),
-            transparency=item.get("transparency"),
-            meeting_url=item.get("meeting_url"),
-            timezone_value=item_timezone,
-            color_id=item.get("color_id"),
-        )
-      elif item_type == "recurring":
-        if item.get("timezone") is None:
-          item["timezone"] = item_timezone
-        event_id = gcal_create_recurring_event(item, session_id=session_id)
+      event_id = gcal_insert_event_body(bodies[0], session_id=session_id)
       if not event_id:
         raise HTTPException(status_code=502,
                             detail=f"Failed to create {item_type} event.")
@@ -931,12 +896,15 @@ def _execute_step(step: PlanStep, session_id: str, timezone_name: str,
     print(f"[EXEC] batch insert: {len(bodies)} events in 1 request")
     event_ids = gcal_batch_insert_events(bodies, session_id=session_id)
     print(f"[EXEC] batch insert done: {sum(1 for eid in event_ids if eid)}/{len(bodies)} succeeded")
+    # Re-fetch created events concurrently instead of one round trip each.
+    sync_google_events_after_write(session_id,
+                                   [eid for eid in event_ids if eid],
+                                   emit_sse=not suppress_sse)
     created_results: List[Dict[str, Any]] = []
     for index, eid in enumerate(event_ids):
       if not eid:
         raise HTTPException(status_code=502,
                             detail=f"Failed to create event at items[{index}].")
-      sync_google_event_after_write(session_id, event_id=eid, emit_sse=not suppress_sse)
       created_results.append({**item_metas[index], "event_id": eid})
 
     primary_event_id = created_results[0]["event_id"]
@@ -974,23 +942,24 @@ def _execute_step(step: PlanStep, session_id: str, timezone_name: str,
           break
       after_event = _event_after_view(item, before_event, target_type)
 
-      gcal_update_event(event_id=event_id,
-                        title=item.get("title"),
-                        start_iso=item.get("start"),
-                        end_iso=item.get("end"),
-                        location=item.get("location"),
-                        all_day=all_day_value,
-                        session_id=session_id,
-                        description=item.get("description"),
-                        reminders=item.get("reminders"),
-                        timezone_value=item.get("timezone") or args.get("timezone") or timezone_name,
-                        start_date=item.get("start_date"),
-                        time_value=item.get("time"),
-                        duration_minutes=item.get("duration_minutes"),
-                        recurrence=item.get("recurrence"),
-                        rrule=item.get("rrule"),
-                        target_type=target_type)
-      sync_google_event_after_write(session_id, event_id=event_id, emit_sse=not suppress_sse)
+      patched = gcal_update_event(event_id=event_id,
+                                  title=item.get("title"),
+                                  start_iso=item.get("start"),
+                                  end_iso=item.get("end"),
+                                  location=item.get("location"),
+                                  all_day=all_day_value,
+                                  session_id=session_id,
+                                  description=item.get("description"),
+                                  reminders=item.get("reminders"),
+                                  timezone_value=item.get("timezone") or args.get("timezone") or timezone_name,
+                                  start_date=item.get("start_date"),
+                                  time_value=item.get("time"),
+                                  duration_minutes=item.get("duration_minutes"),
+                                  recurrence=item.get("recurrence"),
+                                  rrule=item.get("rrule"),
+                                  target_type=target_type)
+      sync_google_event_after_write(session_id, event_id=event_id, emit_sse=not suppress_sse,
+                                    latest=patched)
       return {
           "event_id": event_id,
           "event_ids": [event_id],
@@ -1060,13 +1029,15 @@ def _execute_step(step: PlanStep, session_id: str, timezone_name: str,
     print(f"[EXEC] batch update: {len(batch_entries)} events in 1 request")
     results_ok = gcal_batch_update_events(batch_entries, session_id=session_id)
     print(f"[EXEC] batch update done: {sum(results_ok)}/{len(batch_entries)} succeeded")
+    sync_google_events_after_write(session_id,
+                                   [item_metas[index]["event_id"]
+                                    for index, ok in enumerate(results_ok) if ok],
+                                   emit_sse=not suppress_sse)
     updated_results: List[Dict[str, Any]] = []
     for index, ok in enumerate(results_ok):
       if not ok:
         raise HTTPException(status_code=502,
                             detail=f"Failed to update event at items[{index}].")
-      eid = item_metas[index]["event_id"]
-      sync_google_event_after_write(session_id, event_id=eid, emit_sse=not suppress_sse)
       updated_results.append({
           "before": item_metas[index].get("before"),
           "after": item_metas[index].get("after"),
@@ -1809,7 +1780,7 @@ async def run_full_agent(session_id: str,
     _set_current_node("context_provider")
     _push("context_provider", "running", {"phase": "summary_direct"})
     context_started_at = time.perf_counter()
-    context = load_context(session_id, plan, now_date, timezone_name)
+    context = await asyncio.to_thread(load_context, session_id, plan, now_date, timezone_name)
     context_elapsed_ms = round((time.perf_counter() - context_started_at) * 1000, 1)
     _push("context_provider", "done", {
         "phase": "summary_direct",
@@ -1902,7 +1873,7 @@ async def run_full_agent(session_id: str,
     _set_current_node("context_provider")
     _push("context_provider", "running", {"phase": "pre_extraction"})
     context_started_at = time.perf_counter()
-    context = load_context(session_id, plan, now_date, timezone_name)
+    context = await asyncio.to_thread(load_context, session_id, plan, now_date, timezone_name)
     context_elapsed_ms = round((time.perf_counter() - context_started_at) * 1000, 1)
     _push("context_provider", "done", {
         "phase": "pre_extraction",
@@ -2156,7 +2127,8 @@ async def run_full_agent(session_id: str,
       _set_current_node("context_provider")
       _push("context_provider", "running", {"phase": "post_validation"})
       context_started_at = time.perf_counter()
-      context = load_context(session_id, pre_validated_plan, now_date, timezone_name)
+      context = await asyncio.to_thread(load_context, session_id, pre_validated_plan,
+                                        now_date, timezone_name)
       context_elapsed_ms = round((time.perf_counter() - context_started_at) * 1000, 1)
       _push("context_provider", "done", {
           "phase": "post_validation",
@@ -2258,12 +2230,13 @@ async def run_full_agent(session_id: str,
           "attempt": expand_attempt
       })
       context_started_at = time.perf_counter()
-      context = load_context(session_id,
-                             pre_validated_plan,
-                             now_date,
-                             timezone_name,
-                             override_start_date=new_start,
-                             override_end_date=new_end)
+      context = await asyncio.to_thread(load_context,
+                                        session_id,
+                                        pre_validated_plan,
+                                        now_date,
+                                        timezone_name,
+                                        override_start_date=new_start,
+                                        override_end_date=new_end)
       context_elapsed_ms = round((time.perf_counter() - context_started_at) * 1000, 1)
       _push("context_provider", "done", {
           "phase": "expanded",
@@ -2509,7 +2482,10 @@ async def run_full_agent(session_id: str,
             )
             break
     try:
-      data = _execute_step(step_for_execution, session_id, timezone_name, now_iso, context_for_execution, suppress_sse=True)
+      # googleapiclient execute()는 동기 HTTPS 호출이라 이벤트 루프를 막지 않도록 스레드에서 실행한다.
+      data = await asyncio.to_thread(_execute_step, step_for_execution, session_id,
+                                     timezone_name, now_iso, context_for_execution,
+                                     suppress_sse=True)
       step_result = AgentStepResult(step_id=step.step_id,
                                     intent=step.intent,
                                     ok=True,
@@ -2527,13 +2503,13 @@ async def run_full_agent(session_id: str,
             start_date = try_parse_date(scope.get("start_date"))
             end_date = try_parse_date(scope.get("end_date"))
             if start_date and end_date:
-              context_for_execution["events"] = fetch_google_events_between(
-                  start_date, end_date, session_id)
+              context_for_execution["events"] = await asyncio.to_thread(
+                  fetch_google_events_between, start_date, end_date, session_id)
         except Exception:
           pass
       if step.intent in ("task.create_task", "task.update_task", "task.cancel_task"):
         try:
-          context_for_execution["tasks"] = fetch_google_tasks(session_id)
+          context_for_execution["tasks"] = await asyncio.to_thread(fetch_google_tasks, session_id)
         except Exception:
           pass
     except HTTPException as exc:
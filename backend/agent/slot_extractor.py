@@ -153,7 +153,7 @@ _ITEM_UPDATE_ALLOWED_KEYS = (
     "recurrence",
     "rrule",
 )
-_HHMM_RE = re.compile(r"^\d{2}:\d{2}$")
+_HHMM_RE = re.compile(r"\d{2}:\d{2}", re.ASCII)
 _RRULE_CANDIDATE_RE = re.compile(
     r"(?i)(?:RRULE:\s*|rrule\s+)(FREQ=[A-Z]+[A-Z0-9=,;:+-]*)")
 _SELECTION_SPLIT_RE = re.compile(r"[,;\n]+")
@@ -476,7 +476,7 @@ def _normalize_time_hhmm(value: Any) -> Optional[str]:
   parts = text.split(":")
   if len(parts) >= 2:
     text = f"{parts[0]}:{parts[1]}"
-  if not _HHMM_RE.match(text):
+  if not _HHMM_RE.fullmatch(text):
     return None
   try:
     hour, minute = [int(part) for part in text.split(":")]
@@ -11,8 +11,9 @@ from .config import (
     FRONTEND_STATIC_DIR,
     cors_origins,
 )
+from .llm import close_async_client
 from .routes import router
-from .state import _load_events_from_disk
+from .state import _load_events_from_disk, flush_events_to_disk
 
 app = FastAPI()
 
@@ -36,6 +37,17 @@ _load_events_from_disk()
 
 app.include_router(router)
 
+
+@app.on_event("shutdown")
+async def _shutdown_llm_client() -> None:
+    await close_async_client()
+
+
+@app.on_event("shutdown")
+def _flush_event_store() -> None:
+    flush_events_to_disk()
+
+
 if FRONTEND_STATIC_DIR and FRONTEND_STATIC_DIR.exists():
     app.mount("/",
               StaticFiles(directory=str(FRONTEND_STATIC_DIR), html=True),
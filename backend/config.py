@@ -9,10 +9,12 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 SEOUL = ZoneInfo("Asia/Seoul")
 LLM_DEBUG = os.getenv("LLM_DEBUG", "0") == "1"
 
-ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}$")
-ISO_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
-ISO_DATETIME_24_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T24:00$")
-DATETIME_FLEX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2})(?::\d{2})?$")
+# 고정 형식 패턴이다. re.ASCII로 컴파일하고 호출부에서는 fullmatch로 검사한다.
+ISO_DATETIME_RE = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}", re.ASCII)
+ISO_DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}", re.ASCII)
+ISO_DATETIME_24_RE = re.compile(r"\d{4}-\d{2}-\d{2}T24:00", re.ASCII)
+DATETIME_FLEX_RE = re.compile(r"(\d{4}-\d{2}-\d{2})[ T](\d{2}:\d{2})(?::\d{2})?", re.ASCII)
+HHMM_RE = re.compile(r"\d{2}:\d{2}", re.ASCII)
 
 # -------------------------
 # Google Calendar 설정
@@ -44,12 +46,23 @@ GCAL_RANGE_CACHE_TTL_SECONDS = int(
     os.getenv("GCAL_RANGE_CACHE_TTL_SECONDS", "45"))
 GCAL_TASKS_CACHE_TTL_SECONDS = int(
     os.getenv("GCAL_TASKS_CACHE_TTL_SECONDS", "30"))
+GOOGLE_USERINFO_CACHE_TTL_SECONDS = int(
+    os.getenv("GOOGLE_USERINFO_CACHE_TTL_SECONDS", "300"))
 SESSION_COOKIE_NAME = "gcal_session"
 OAUTH_STATE_COOKIE_NAME = "gcal_oauth_state"
 SESSION_COOKIE_MAX_AGE_SECONDS = int(
     os.getenv("GCAL_SESSION_MAX_AGE_SECONDS", str(60 * 60 * 24 * 30)))
 OAUTH_STATE_MAX_AGE_SECONDS = int(
     os.getenv("GCAL_OAUTH_STATE_MAX_AGE_SECONDS", "600"))
+OAUTH_STATE_MAX_ENTRIES = int(
+    os.getenv("GCAL_OAUTH_STATE_MAX_ENTRIES", "10000"))
+GOOGLE_CACHE_MAX_SESSIONS = int(
+    os.getenv("GOOGLE_CACHE_MAX_SESSIONS", "1024"))
+CONTEXT_CACHE_MAX_ENTRIES = int(
+    os.getenv("CONTEXT_CACHE_MAX_ENTRIES", "2048"))
+GOOGLE_SERVICE_CACHE_MAX_ENTRIES = int(
+    os.getenv("GOOGLE_SERVICE_CACHE_MAX_ENTRIES", "512"))
+GOOGLE_IO_CONCURRENCY = max(1, int(os.getenv("GOOGLE_IO_CONCURRENCY", "8")))
 COOKIE_SECURE = os.getenv("COOKIE_SECURE", "0") == "1"
 API_BASE = os.getenv("API_BASE", "/api")
 FRONTEND_BASE_URL = os.getenv("FRONTEND_BASE_URL", "").rstrip("/")
@@ -60,6 +73,7 @@ FRONTEND_DIR = NEXT_FRONTEND_DIR if USE_NEXT_FRONTEND else LEGACY_FRONTEND_DIR
 FRONTEND_STATIC_DIR = NEXT_FRONTEND_DIR if USE_NEXT_FRONTEND else None
 EVENTS_DATA_FILE = pathlib.Path(
     os.getenv("EVENTS_DATA_FILE", str(BASE_DIR / "events_data.json")))
+EVENTS_SAVE_DEBOUNCE_SECONDS = float(os.getenv("EVENTS_SAVE_DEBOUNCE_SECONDS", "0.25"))
 
 CORS_ALLOW_ORIGINS = os.getenv("CORS_ALLOW_ORIGINS", "")
 CORS_ALLOW_ORIGIN_REGEX = os.getenv("CORS_ALLOW_ORIGIN_REGEX", "").strip()
@@ -86,6 +100,8 @@ DEFAULT_CONTEXT_DAYS = 120
 MAX_CONTEXT_EVENTS = 200
 MAX_CONTEXT_SLICES = 4
 MAX_CONTEXT_DATES = 8
+# 첫 LLM 호출과 동시에 기본 컨텍스트 범위의 Google 일정을 미리 캐시에 채운다(Google API 호출 증가).
+SPECULATIVE_CONTEXT_PREFETCH = os.getenv("SPECULATIVE_CONTEXT_PREFETCH", "0") == "1"
 MAX_RECURRENCE_EXPANSION_DAYS = 365
 MAX_RECURRENCE_OCCURRENCES = 400
 RECURRENCE_OCCURRENCE_SCALE = 10000
@@ -1,7 +1,16 @@
 from __future__ import annotations
 
+import re
+from typing import List
+
 from .config import FRONTEND_DIR, USE_NEXT_FRONTEND
 
+HEADER_ACTIONS_MARKER = "__HEADER_ACTIONS__"
+APP_CONTEXT_MARKER = "__APP_CONTEXT_SCRIPT__"
+_FULLCALENDAR_CSS_URL = "https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/index.global.min.css"
+_FULLCALENDAR_JS_URL = "https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/index.global.min.js"
+_CALENDAR_APP_JS_URL = "/calendar-app.js"
+
 
 def _load_frontend_html(filename: str) -> str:
     path = FRONTEND_DIR / filename
@@ -25,3 +34,43 @@ else:
     CALENDAR_HTML_TEMPLATE = _load_frontend_html("calendar.html")
     SETTINGS_HTML = _load_frontend_html("settings.html")
     LOGIN_HTML = START_HTML
+
+
+def _has_script_src(text: str, src: str) -> bool:
+    return f'src="{src}"' in text or f"src='{src}'" in text
+
+
+def _insert_before_close(html: str, closing_tag: str, snippet: str, append: bool = False) -> str:
+    if closing_tag in html:
+        return html.replace(closing_tag, f"{snippet}\n{closing_tag}", 1)
+    return html + snippet if append else snippet + html
+
+
+def _split_calendar_template(template: str) -> List[str]:
+    """요청마다 바뀌지 않는 태그 삽입을 미리 해 두고, 치환 위치(marker) 기준으로 나눈다.
+
+    결과는 [문자열, marker, 문자열, marker, ...] 순서라 요청 시에는 join만 하면 된다.
+    """
+    html = _insert_before_close(template, "</head>", APP_CONTEXT_MARKER)
+    if _FULLCALENDAR_CSS_URL not in html:
+        html = _insert_before_close(html, "</head>",
+                                    f'<link rel="stylesheet" href="{_FULLCALENDAR_CSS_URL}">')
+    if not _has_script_src(html, _FULLCALENDAR_JS_URL):
+        html = _insert_before_close(html, "</head>",
+                                    f'<script src="{_FULLCALENDAR_JS_URL}" defer></script>')
+    if not _has_script_src(html, _CALENDAR_APP_JS_URL):
+        html = _insert_before_close(html, "</body>",
+                                    f'<script src="{_CALENDAR_APP_JS_URL}" defer></script>',
+                                    append=True)
+    return re.split(f"({HEADER_ACTIONS_MARKER}|{APP_CONTEXT_MARKER})", html)
+
+
+CALENDAR_TEMPLATE_PARTS = _split_calendar_template(CALENDAR_HTML_TEMPLATE)
+
+
+def render_calendar_html(actions_html: str, context_script: str) -> str:
+    return "".join(
+        actions_html if part == HEADER_ACTIONS_MARKER
+        else context_script if part == APP_CONTEXT_MARKER
+        else part
+        for part in CALENDAR_TEMPLATE_PARTS)
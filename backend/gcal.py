@@ -8,21 +8,47 @@ import os
 import pathlib
 import re
 import secrets
+import sys
+import tempfile
+import threading
 import time
+from bisect import bisect_left
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone, date
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import httplib2
 import requests
+from requests.adapters import HTTPAdapter
 from fastapi import HTTPException, Request, Response
 
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request as GoogleRequest
-from googleapiclient.discovery import build
+from google_auth_httplib2 import AuthorizedHttp
+from googleapiclient.discovery import build, build_from_document
 from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
+
+try:
+  import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+  orjson = None  # type: ignore
+
+try:
+  import ciso8601  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+  ciso8601 = None  # type: ignore
+
+try:
+  from googleapiclient.discovery_cache import get_static_doc  # type: ignore
+except Exception:  # pragma: no cover - older google-api-python-client
+  get_static_doc = None  # type: ignore
 
 from .config import (
     ENABLE_GCAL,
-    ISO_DATETIME_RE,
+    HHMM_RE,
     GOOGLE_CLIENT_ID,
     GOOGLE_CLIENT_SECRET,
     GOOGLE_REDIRECT_URI,
@@ -35,6 +61,12 @@ from .config import (
     GCAL_WATCH_LEEWAY_SECONDS,
     GCAL_RANGE_CACHE_TTL_SECONDS,
     GCAL_TASKS_CACHE_TTL_SECONDS,
+    GOOGLE_USERINFO_CACHE_TTL_SECONDS,
+    GOOGLE_CACHE_MAX_SESSIONS,
+    GOOGLE_IO_CONCURRENCY,
+    CONTEXT_CACHE_MAX_ENTRIES,
+    GOOGLE_SERVICE_CACHE_MAX_ENTRIES,
+    OAUTH_STATE_MAX_ENTRIES,
     SESSION_COOKIE_NAME,
     OAUTH_STATE_COOKIE_NAME,
     SESSION_COOKIE_MAX_AGE_SECONDS,
@@ -56,14 +88,93 @@ from .utils import (
     _normalize_google_timestamp,
     _split_iso_date_time,
     _compute_all_day_bounds,
+    _parse_iso_minute,
+    _is_iso_datetime,
+    _format_iso_minute,
 )
 from .recurrence import recurring_to_rrule
 
 # gcal 愿??罹먯떆
-google_events_cache: Dict[str, Dict[str, Any]] = {}
-context_cache: Dict[str, Dict[str, Any]] = {}
+class _LRUCache(OrderedDict):
+  """최근 사용 순서로 maxsize개까지만 보관하는 dict. 스레드풀 핸들러에서도 쓰이므로 락으로 감싼다."""
+
+  def __init__(self, maxsize: int):
+    super().__init__()
+    self.maxsize = maxsize
+    # OrderedDict의 pop/popitem은 서브클래스의 __getitem__을 다시 부르므로 재진입 가능한 락이어야 한다.
+    self._lock = threading.RLock()
+
+  def get(self, key, default=None):
+    with self._lock:
+      if key not in self:
+        return default
+      self.move_to_end(key)
+      return super().__getitem__(key)
+
+  def __getitem__(self, key):
+    with self._lock:
+      return super().__getitem__(key)
+
+  def __setitem__(self, key, value):
+    with self._lock:
+      super().__setitem__(key, value)
+      self.move_to_end(key)
+      while len(self) > self.maxsize:
+        self.popitem(last=False)
+
+  def setdefault(self, key, default=None):
+    with self._lock:
+      if key in self:
+        self.move_to_end(key)
+        return super().__getitem__(key)
+      self[key] = default
+      return default
+
+  def pop(self, key, *args):
+    with self._lock:
+      return super().pop(key, *args)
+
+
+class _OrjsonModel(JsonModel):
+  """JsonModel that encodes/decodes API bodies with orjson when it is installed."""
+
+  def serialize(self, body_value):
+    if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+      body_value = {"data": body_value}
+    try:
+      return orjson.dumps(body_value).decode("utf-8")
+    except TypeError:
+      return super().serialize(body_value)
+
+  def deserialize(self, content):
+    try:
+      body = orjson.loads(content)
+    except orjson.JSONDecodeError:
+      return super().deserialize(content)
+    if self._data_wrapper and isinstance(body, dict) and "data" in body:
+      body = body["data"]
+    return body
+
+
+def _google_api_model() -> Optional[JsonModel]:
+  return _OrjsonModel() if orjson is not None else None
+
+
+google_events_cache: Dict[str, Dict[str, Any]] = _LRUCache(GOOGLE_CACHE_MAX_SESSIONS)
+context_cache: Dict[str, Dict[str, Any]] = _LRUCache(CONTEXT_CACHE_MAX_ENTRIES)
 oauth_state_store: Dict[str, Dict[str, Any]] = {}
 google_sse_subscribers: Dict[str, List[asyncio.Queue]] = {}
+# (session key, api, thread id) -> (Credentials, service). httplib2 기반 service는 스레드 간 공유하지 않는다.
+# 세션 x 워커 스레드 수만큼 늘어나므로 다른 세션 캐시처럼 크기를 제한한다.
+google_service_cache: Dict[Tuple[str, str, int], Tuple[Credentials, Any]] = _LRUCache(
+    GOOGLE_SERVICE_CACHE_MAX_ENTRIES)
+# Shared pool for fanning out independent Google API round trips. Threads are
+# long-lived so the per-thread service cache above is reused across calls.
+_google_io_executor = ThreadPoolExecutor(max_workers=GOOGLE_IO_CONCURRENCY,
+                                         thread_name_prefix="gcal-io")
+# OAuth 토큰 교환/갱신, userinfo 호출이 TLS 연결을 재사용하도록 공유하는 세션.
+google_http_session = requests.Session()
+google_http_session.mount("https://", HTTPAdapter(pool_connections=20, pool_maxsize=50))
 
 def is_gcal_configured() -> bool:
   return bool(ENABLE_GCAL and GOOGLE_CLIENT_ID and GOOGLE_CLIENT_SECRET
@@ -81,6 +192,7 @@ def _normalize_session_id(raw: Optional[str]) -> Optional[str]:
   return value
 
 
+@lru_cache(maxsize=4096)
 def _session_key(session_id: str) -> str:
   return hashlib.sha256(session_id.encode("utf-8")).hexdigest()
 
@@ -318,9 +430,22 @@ def _store_oauth_state(state_value: str,
   }
   if redirect_uri:
     entry["redirect_uri"] = redirect_uri
+  _prune_oauth_states(entry["created_at"])
   oauth_state_store[state_value] = entry
 
 
+def _prune_oauth_states(now: float) -> None:
+  # 삽입 순서가 곧 생성 순서이므로 앞에서부터 만료/초과분만 걷어낸다.
+  cutoff = now - OAUTH_STATE_MAX_AGE_SECONDS
+  while oauth_state_store:
+    oldest_key = next(iter(oauth_state_store))
+    oldest = oauth_state_store[oldest_key]
+    if (len(oauth_state_store) < OAUTH_STATE_MAX_ENTRIES
+        and float(oldest.get("created_at") or 0) >= cutoff):
+      break
+    oauth_state_store.pop(oldest_key, None)
+
+
 def _pop_oauth_state(state_value: Optional[str]) -> Optional[Dict[str, Any]]:
   if not state_value:
     return None
@@ -376,17 +501,34 @@ def _resolve_google_redirect_uri(request: Request) -> Optional[str]:
   return f"{request_base}/auth/google/callback"
 
 
+# 세션 키 -> (파일 mtime_ns, 파싱된 토큰). 파일이 그대로면 stat 한 번으로 끝난다.
+_token_cache: Dict[str, Tuple[int, Dict[str, Any]]] = _LRUCache(1024)
+
+
 def load_gcal_token_for_session(session_id: Optional[str]) -> Optional[Dict[str, Any]]:
   if not session_id:
     return None
   path = _session_token_path(session_id)
-  if not path.exists():
+  try:
+    mtime_ns = path.stat().st_mtime_ns
+  except OSError:
     return None
+  key = _session_key(session_id)
+  cached = _token_cache.get(key)
+  if cached is not None and cached[0] == mtime_ns:
+    return dict(cached[1])
   try:
-    with path.open("r", encoding="utf-8") as f:
-      return json.load(f)
+    raw = path.read_bytes()
+    if orjson is not None:
+      data = orjson.loads(raw)
+    else:
+      data = json.loads(raw)
   except Exception:
     return None
+  if isinstance(data, dict):
+    _token_cache[key] = (mtime_ns, data)
+    return dict(data)
+  return data
 
 
 def load_gcal_token_for_request(request: Request) -> Optional[Dict[str, Any]]:
@@ -398,14 +540,45 @@ def save_gcal_token_for_session(session_id: str, data: Dict[str, Any]) -> None:
   if not session_id:
     return
   _ensure_token_dir()
+  _invalidate_google_services(session_id)
+  _token_cache.pop(_session_key(session_id), None)
   path = _session_token_path(session_id)
-  path.write_text(json.dumps(data, ensure_ascii=False, indent=2),
-                  encoding="utf-8")
+  if orjson is not None:
+    new_bytes = orjson.dumps(data,
+                             option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+  else:
+    new_bytes = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+  try:
+    if path.read_bytes() == new_bytes:
+      return
+  except OSError:
+    pass
+  # 쓰는 도중 프로세스가 죽어도 토큰 파일이 깨지지 않도록 임시 파일에 쓰고 교체한다.
+  # 같은 세션의 토큰을 여러 스레드가 동시에 갱신할 수 있어 임시 파일은 저장마다 따로 만든다.
+  tmp_name: Optional[str] = None
+  try:
+    with tempfile.NamedTemporaryFile(dir=path.parent,
+                                     prefix=path.name + ".",
+                                     suffix=".tmp",
+                                     delete=False) as tmp:
+      tmp_name = tmp.name
+      tmp.write(new_bytes)
+    os.replace(tmp_name, path)
+  except Exception:
+    if tmp_name is not None:
+      try:
+        os.unlink(tmp_name)
+      except OSError:
+        pass
+    raise
 
 
 def clear_gcal_token_for_session(session_id: Optional[str]) -> None:
   if not session_id:
     return
+  _invalidate_google_services(session_id)
+  _token_cache.pop(_session_key(session_id), None)
+  _userinfo_cache.pop(_session_key(session_id), None)
   try:
     path = _session_token_path(session_id)
     if path.exists():
@@ -414,9 +587,56 @@ def clear_gcal_token_for_session(session_id: Optional[str]) -> None:
     pass
 
 
+def _event_start_key(ev: Any) -> str:
+  if not isinstance(ev, dict):
+    return ""
+  return ev.get("start") or ""
+
+
+class _SortedEventMap(dict):
+  """Cached events keyed by cache key, with a start-sorted view rebuilt only after writes."""
+
+  def __init__(self, *args, **kwargs):
+    super().__init__(*args, **kwargs)
+    self._sorted: Optional[List[Dict[str, Any]]] = None
+
+  def __setitem__(self, key, value):
+    self._sorted = None
+    super().__setitem__(key, value)
+
+  def __delitem__(self, key):
+    self._sorted = None
+    super().__delitem__(key)
+
+  def pop(self, key, *default):
+    self._sorted = None
+    return super().pop(key, *default)
+
+  def popitem(self):
+    self._sorted = None
+    return super().popitem()
+
+  def clear(self):
+    self._sorted = None
+    super().clear()
+
+  def update(self, *args, **kwargs):
+    self._sorted = None
+    super().update(*args, **kwargs)
+
+  def setdefault(self, key, default=None):
+    self._sorted = None
+    return super().setdefault(key, default)
+
+  def sorted_values(self) -> List[Dict[str, Any]]:
+    if self._sorted is None:
+      self._sorted = sorted(self.values(), key=_event_start_key)
+    return self._sorted
+
+
 def _empty_google_cache() -> Dict[str, Any]:
   return {
-      "events": {},
+      "events": _SortedEventMap(),
       "calendars": {},
       "coverage_start": None,
       "coverage_end": None,
@@ -450,8 +670,8 @@ def _get_google_cache(session_id: str) -> Dict[str, Any]:
   if not isinstance(cache, dict):
     cache = _empty_google_cache()
     google_events_cache[key] = cache
-  if not isinstance(cache.get("events"), dict):
-    cache["events"] = {}
+  if not isinstance(cache.get("events"), _SortedEventMap):
+    cache["events"] = _SortedEventMap(cache.get("events") or {})
   if not isinstance(cache.get("calendars"), dict):
     cache["calendars"] = {}
   if not isinstance(cache.get("tasks"), list):
@@ -587,11 +807,15 @@ def _clear_context_cache(cache_key: Optional[str]) -> None:
   context_cache.pop(cache_key, None)
 
 
+_CACHED_CONTEXT_MARKER_RE = re.compile(
+    "|".join(re.escape(marker) for marker in ("assistant:", "user:", "?ъ슜??")),
+    re.IGNORECASE)
+
+
 def _should_use_cached_context(text: str) -> bool:
   if not text:
     return False
-  lowered = text.lower()
-  return "assistant:" in lowered or "user:" in lowered or "?ъ슜??" in text
+  return _CACHED_CONTEXT_MARKER_RE.search(text) is not None
 
 
 def get_google_session_id(request: Request) -> Optional[str]:
@@ -612,30 +836,30 @@ def require_google_session_id(request: Request) -> str:
   return session_id
 
 
-def get_gcal_service(session_id: str):
-  if not is_gcal_configured():
-    raise RuntimeError("Google Calendar is not configured.")
-
-  token_data = load_gcal_token_for_session(session_id)
-  if not token_data:
-    raise RuntimeError(
-        "Google OAuth token not found. Run /auth/google/login first.")
-
-  creds = Credentials.from_authorized_user_info(token_data, GCAL_SCOPES)
+def _invalidate_google_services(session_id: str) -> None:
+  key = _session_key(session_id)
+  for cache_key in list(google_service_cache):
+    if cache_key[0] == key:
+      google_service_cache.pop(cache_key, None)
 
-  if creds.expired and creds.refresh_token:
-    creds.refresh(GoogleRequest())
-    new_data = json.loads(creds.to_json())
-    save_gcal_token_for_session(session_id, new_data)
 
-  service = build("calendar", "v3", credentials=creds)
-  return service
+@lru_cache(maxsize=None)
+def _static_discovery_document(api: str, version: str) -> Optional[str]:
+  """패키지에 들어 있는 discovery 문서를 한 번만 읽는다. 파싱된 dict는 빌드 중 수정되므로 문자열로 둔다."""
+  if get_static_doc is None:
+    return None
+  return get_static_doc(api, version)
 
 
-def get_google_tasks_service(session_id: str):
+def _get_google_api_service(session_id: str, api: str, version: str):
   if not is_gcal_configured():
     raise RuntimeError("Google Calendar is not configured.")
 
+  cache_key = (_session_key(session_id), api, threading.get_ident())
+  cached = google_service_cache.get(cache_key)
+  if cached is not None and not cached[0].expired:
+    return cached[1]
+
   token_data = load_gcal_token_for_session(session_id)
   if not token_data:
     raise RuntimeError(
@@ -644,14 +868,33 @@ def get_google_tasks_service(session_id: str):
   creds = Credentials.from_authorized_user_info(token_data, GCAL_SCOPES)
 
   if creds.expired and creds.refresh_token:
-    creds.refresh(GoogleRequest())
+    creds.refresh(GoogleRequest(session=google_http_session))
     new_data = json.loads(creds.to_json())
     save_gcal_token_for_session(session_id, new_data)
 
-  service = build("tasks", "v1", credentials=creds)
+  document = _static_discovery_document(api, version)
+  if document is not None:
+    service = build_from_document(document,
+                                  credentials=creds,
+                                  model=_google_api_model())
+  else:
+    service = build(api,
+                    version,
+                    credentials=creds,
+                    cache_discovery=False,
+                    model=_google_api_model())
+  google_service_cache[cache_key] = (creds, service)
   return service
 
 
+def get_gcal_service(session_id: str):
+  return _get_google_api_service(session_id, "calendar", "v3")
+
+
+def get_google_tasks_service(session_id: str):
+  return _get_google_api_service(session_id, "tasks", "v1")
+
+
 def _get_google_tasks_cache_entry(session_id: str) -> Dict[str, Any]:
   entry = _get_google_cache(session_id)
   if not isinstance(entry.get("tasks"), list):
@@ -756,6 +999,10 @@ def emit_google_task_delta(session_id: str,
   }
 
 
+# 세션 키 -> (조회 시각, userinfo). 프로필은 거의 바뀌지 않아 상태 조회마다 Google을 부르지 않는다.
+_userinfo_cache: Dict[str, Tuple[float, Dict[str, Any]]] = _LRUCache(1024)
+
+
 def get_google_userinfo(request: Request) -> Optional[Dict[str, Any]]:
   session_id = _get_session_id(request)
   if not session_id:
@@ -763,16 +1010,20 @@ def get_google_userinfo(request: Request) -> Optional[Dict[str, Any]]:
   token_data = load_gcal_token_for_session(session_id)
   if not token_data:
     return None
+  key = _session_key(session_id)
+  cached = _userinfo_cache.get(key)
+  if cached is not None and time.time() - cached[0] <= GOOGLE_USERINFO_CACHE_TTL_SECONDS:
+    return dict(cached[1])
   creds = Credentials.from_authorized_user_info(token_data, GCAL_SCOPES)
   if creds.expired and creds.refresh_token:
-    creds.refresh(GoogleRequest())
+    creds.refresh(GoogleRequest(session=google_http_session))
     new_data = json.loads(creds.to_json())
     save_gcal_token_for_session(session_id, new_data)
   access_token = creds.token
   if not access_token:
     return None
   try:
-    response = requests.get(
+    response = google_http_session.get(
         "https://openidconnect.googleapis.com/v1/userinfo",
         headers={"Authorization": f"Bearer {access_token}"},
         timeout=5,
@@ -785,7 +1036,10 @@ def get_google_userinfo(request: Request) -> Optional[Dict[str, Any]]:
     payload = response.json()
   except Exception:
     return None
-  return payload if isinstance(payload, dict) else None
+  if not isinstance(payload, dict):
+    return None
+  _userinfo_cache[key] = (time.time(), payload)
+  return dict(payload)
 
 
 def list_google_calendars(session_id: str) -> List[Dict[str, Any]]:
@@ -897,6 +1151,41 @@ def gcal_create_single_event(title: str,
   if not session_id:
     raise HTTPException(status_code=401, detail="Google login is required.")
 
+  try:
+    # Do not auto-infer all-day from start/end shape.
+    # Treat as all-day only when caller explicitly sets all_day=True.
+    event_body = _build_single_event_body(title,
+                                          start_iso,
+                                          end_iso,
+                                          location,
+                                          all_day=all_day,
+                                          description=description,
+                                          attendees=attendees,
+                                          reminders=reminders,
+                                          visibility=visibility,
+                                          transparency=transparency,
+                                          meeting_url=meeting_url,
+                                          timezone_value=timezone_value,
+                                          color_id=color_id)
+  except Exception as e:
+    _log_debug(f"[GCAL] create single event error: {e}")
+    raise HTTPException(status_code=502,
+                        detail=f"Google event create failed: {e}") from e
+  return gcal_insert_event_body(event_body,
+                                session_id=session_id,
+                                calendar_id=calendar_id)
+
+
+def gcal_insert_event_body(event_body: Dict[str, Any],
+                           session_id: Optional[str] = None,
+                           calendar_id: Optional[str] = None) -> str:
+  """Insert an already-built event body (single or recurring) and return its id."""
+  if not is_gcal_configured():
+    raise HTTPException(status_code=400,
+                        detail="Google Calendar integration is not configured.")
+  if not session_id:
+    raise HTTPException(status_code=401, detail="Google login is required.")
+
   try:
     service = get_gcal_service(session_id)
   except Exception as e:
@@ -905,50 +1194,6 @@ def gcal_create_single_event(title: str,
                         detail=f"Google Calendar service error: {e}") from e
 
   try:
-    # Do not auto-infer all-day from start/end shape.
-    # Treat as all-day only when caller explicitly sets all_day=True.
-    use_all_day = bool(all_day)
-
-    event_body: Dict[str, Any] = {"summary": title}
-    merged_description = _merge_description(description, meeting_url)
-    if merged_description is not None:
-      event_body["description"] = merged_description
-    attendees_value = _build_gcal_attendees(attendees)
-    if attendees_value is not None:
-      event_body["attendees"] = attendees_value
-    reminders_value = _build_gcal_reminders(reminders)
-    if reminders_value is not None:
-      event_body["reminders"] = reminders_value
-    visibility_value = _normalize_visibility(visibility)
-    if visibility_value is not None:
-      event_body["visibility"] = visibility_value
-    transparency_value = _normalize_transparency(transparency)
-    if transparency_value is not None:
-      event_body["transparency"] = transparency_value
-    color_value = _normalize_color_id(color_id)
-    if color_value is not None:
-      event_body["colorId"] = color_value
-
-    if use_all_day:
-      start_date_obj, end_exclusive = _compute_all_day_bounds(start_iso, end_iso)
-      event_body["start"] = {"date": start_date_obj.strftime("%Y-%m-%d")}
-      event_body["end"] = {"date": end_exclusive.strftime("%Y-%m-%d")}
-    else:
-      start_dt = datetime.strptime(start_iso,
-                                   "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
-      if end_iso:
-        end_dt = datetime.strptime(end_iso,
-                                   "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
-      else:
-        end_dt = start_dt + timedelta(hours=1)
-
-      tz_value = timezone_value or "Asia/Seoul"
-      event_body["start"] = {"dateTime": start_dt.isoformat(), "timeZone": tz_value}
-      event_body["end"] = {"dateTime": end_dt.isoformat(), "timeZone": tz_value}
-
-    if location:
-      event_body["location"] = location
-
     created = service.events().insert(calendarId=calendar_id
                                       or GOOGLE_CALENDAR_ID,
                                       body=event_body).execute()
@@ -960,7 +1205,7 @@ def gcal_create_single_event(title: str,
   except HTTPException:
     raise
   except Exception as e:
-    _log_debug(f"[GCAL] create single event error: {e}")
+    _log_debug(f"[GCAL] create event error: {e}")
     raise HTTPException(status_code=502,
                         detail=f"Google event create failed: {e}") from e
 
@@ -1006,7 +1251,7 @@ def _build_gcal_event_body(title: Optional[str],
       body["colorId"] = None
 
   if start_iso is not None:
-    if not isinstance(start_iso, str) or not ISO_DATETIME_RE.match(start_iso):
+    if not isinstance(start_iso, str) or not _is_iso_datetime(start_iso):
       raise ValueError("Invalid start time for Google Calendar update.")
 
     # Do not auto-infer all-day from start/end shape.
@@ -1017,21 +1262,19 @@ def _build_gcal_event_body(title: Optional[str],
       start_date, end_exclusive = _compute_all_day_bounds(start_iso, end_iso)
       # Internal representation uses exclusive end (next day 00:00) for all-day spans.
       body["start"] = {
-          "date": start_date.strftime("%Y-%m-%d"),
+          "date": start_date.isoformat(),
           "dateTime": None,
           "timeZone": None,
       }
       body["end"] = {
-          "date": end_exclusive.strftime("%Y-%m-%d"),
+          "date": end_exclusive.isoformat(),
           "dateTime": None,
           "timeZone": None,
       }
     else:
-      start_dt = datetime.strptime(start_iso,
-                                   "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
+      start_dt = _parse_iso_minute(start_iso, SEOUL)
       if end_iso:
-        end_dt = datetime.strptime(end_iso,
-                                   "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
+        end_dt = _parse_iso_minute(end_iso, SEOUL)
       else:
         end_dt = start_dt + timedelta(hours=1)
       tz_value = timezone_value or "Asia/Seoul"
@@ -1048,21 +1291,20 @@ def _build_gcal_event_body(title: Optional[str],
       }
   else:
     if end_iso is not None:
-      if not isinstance(end_iso, str) or not ISO_DATETIME_RE.match(end_iso):
+      if not isinstance(end_iso, str) or not _is_iso_datetime(end_iso):
         raise ValueError("Invalid end time for Google Calendar update.")
       use_all_day = bool(all_day)
       if use_all_day:
         # Internal representation uses exclusive end (next day 00:00) for all-day spans.
         end_dt, end_time = _split_iso_date_time(end_iso)
         if end_time == "00:00":
-          body["end"] = {"date": end_dt.strftime("%Y-%m-%d")}
+          body["end"] = {"date": end_dt.isoformat()}
         else:
           # Fallback for old inclusive format (T23:59 or other)
-          body["end"] = {"date": (end_dt + timedelta(days=1)).strftime("%Y-%m-%d")}
+          body["end"] = {"date": (end_dt + timedelta(days=1)).isoformat()}
       else:
         tz_value = timezone_value or "Asia/Seoul"
-        end_dt = datetime.strptime(end_iso,
-                                   "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
+        end_dt = _parse_iso_minute(end_iso, SEOUL)
         body["end"] = {"dateTime": end_dt.isoformat(), "timeZone": tz_value}
     if all_day is not None:
       raise ValueError("all_day requires start for Google Calendar update.")
@@ -1081,7 +1323,7 @@ def _google_datetime_to_iso_minute(value: Any) -> Optional[str]:
     dt = datetime.fromisoformat(text)
   except Exception:
     return None
-  return dt.strftime("%Y-%m-%dT%H:%M")
+  return _format_iso_minute(dt)
 
 
 def _extract_existing_event_bounds(raw_event: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Optional[bool], Optional[str]]:
@@ -1103,9 +1345,9 @@ def _extract_existing_event_bounds(raw_event: Dict[str, Any]) -> Tuple[Optional[
     else:
       # Fallback to next day 00:00 if end date is missing
       try:
-        start_dt_obj = datetime.strptime(start_date[:10], "%Y-%m-%d").date()
+        start_dt_obj = date.fromisoformat(start_date[:10])
         end_dt_obj = start_dt_obj + timedelta(days=1)
-        end_iso = f"{end_dt_obj.strftime('%Y-%m-%d')}T00:00"
+        end_iso = f"{end_dt_obj.isoformat()}T00:00"
       except Exception:
         end_iso = f"{start_date[:10]}T00:00"
     return start_iso, end_iso, True, None
@@ -1202,7 +1444,7 @@ def _prepare_update_event(
         end_dt = start_dt + timedelta(minutes=normalized_duration)
       else:
         end_dt = start_dt + timedelta(hours=1)
-      patched_end_iso = end_dt.strftime("%Y-%m-%dT%H:%M")
+      patched_end_iso = _format_iso_minute(end_dt)
     if patched_all_day is None:
       patched_all_day = False
   elif normalized_start_date and patched_start_iso is None:
@@ -1212,7 +1454,7 @@ def _prepare_update_event(
         try:
           s_date = datetime.strptime(normalized_start_date, "%Y-%m-%d").date()
           e_date = s_date + timedelta(days=1)
-          patched_end_iso = f"{e_date.strftime('%Y-%m-%d')}T00:00"
+          patched_end_iso = f"{e_date.isoformat()}T00:00"
         except Exception:
           patched_end_iso = f"{normalized_start_date}T00:00"
       if patched_all_day is None:
@@ -1311,7 +1553,8 @@ def gcal_update_event(event_id: str,
                       recurrence: Optional[Dict[str, Any]] = None,
                       rrule: Optional[str] = None,
                       target_type: Optional[str] = None,
-                      calendar_id: Optional[str] = None) -> None:
+                      calendar_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+  """Patch한 뒤 응답의 이벤트를 정규화해 돌려준다(cancelled이거나 정규화 실패면 None)."""
   if not is_gcal_configured():
     raise RuntimeError("Google Calendar is not configured.")
   if not session_id:
@@ -1330,12 +1573,20 @@ def gcal_update_event(event_id: str,
   )
 
   service = get_gcal_service(session_id)
-  service.events().patch(calendarId=resolved_cal,
-                         eventId=raw_event_id,
-                         body=body).execute()
+  patched = service.events().patch(calendarId=resolved_cal,
+                                   eventId=raw_event_id,
+                                   body=body,
+                                   fields=_GCAL_EVENT_FIELDS).execute()
+  if not isinstance(patched, dict) or patched.get("status") == "cancelled":
+    return None
+  if not (calendar_id or _split_gcal_event_key(event_id)[1]):
+    # 기본 캘린더 별칭으로 보낸 경우 캐시의 캘린더 id와 다를 수 있어 재조회에 맡긴다.
+    return None
+  return _normalize_gcal_event(patched, resolved_cal, session_id) or None
 
 
 _BYDAY_MAP = {"MO": 0, "TU": 1, "WE": 2, "TH": 3, "FR": 4, "SA": 5, "SU": 6}
+_BYDAY_PARAM_RE = re.compile(r"BYDAY=([^;]+)")
 
 
 def _align_start_to_byday(start_date: date, rrule_core: str) -> date:
@@ -1344,7 +1595,7 @@ def _align_start_to_byday(start_date: date, rrule_core: str) -> date:
   Google Calendar uses DTSTART as a reference; if DTSTART falls on a weekday
   not listed in BYDAY, the generated instances may be wrong or missing.
   """
-  byday_match = re.search(r"BYDAY=([^;]+)", rrule_core)
+  byday_match = _BYDAY_PARAM_RE.search(rrule_core)
   if not byday_match:
     return start_date
   allowed: set[int] = set()
@@ -1367,47 +1618,15 @@ def gcal_create_recurring_event(item: Dict[str, Any],
   if not is_gcal_configured() or not session_id:
     return None
 
-  rrule_core = recurring_to_rrule(item)
-  if not rrule_core:
-    _log_debug(f"[GCAL] recurring_to_rrule returned falsy: {rrule_core!r}, "
-               f"item recurrence={item.get('recurrence')}, rrule={item.get('rrule')}")
-    return None
-
-  _log_debug(f"[GCAL] recurring_to_rrule result: {rrule_core}")
-
-  title = (item.get("title") or "").strip()
-  if not title:
-    _log_debug("[GCAL] recurring event title is empty")
-    return None
-
-  start_date_str = item.get("start_date")
-  time_str = item.get("time")
-  duration_minutes = item.get("duration_minutes")
-  location = item.get("location")
-  description = item.get("description")
-  attendees = item.get("attendees")
-  reminders = item.get("reminders")
-  visibility = item.get("visibility")
-  transparency = item.get("transparency")
-  meeting_url = item.get("meeting_url")
-  color_id = item.get("color_id")
-  timezone_value = item.get("timezone") or "Asia/Seoul"
-
-  if not isinstance(start_date_str, str):
-    return None
-
   try:
-    start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
-  except Exception:
+    event_body = _build_recurring_event_body(item)
+  except Exception as e:
+    _log_debug(f"[GCAL] build recurring event body error: {e}")
+    return None
+  if event_body is None:
+    _log_debug(f"[GCAL] recurring event body is invalid: "
+               f"item recurrence={item.get('recurrence')}, rrule={item.get('rrule')}")
     return None
-
-  # Align start_date to the first matching BYDAY so Google Calendar generates
-  # correct recurring instances.  e.g. if start_date is Wed but BYDAY=TU,TH,
-  # advance to the next Thu.
-  start_date = _align_start_to_byday(start_date, rrule_core)
-
-  all_day = not (isinstance(time_str, str)
-                 and re.match(r"^\d{2}:\d{2}$", time_str.strip()))
 
   try:
     service = get_gcal_service(session_id)
@@ -1416,60 +1635,6 @@ def gcal_create_recurring_event(item: Dict[str, Any],
     return None
 
   try:
-    event_body: Dict[str, Any] = {
-        "summary": title,
-        "recurrence": [f"RRULE:{rrule_core}"]
-    }
-    merged_description = _merge_description(description, meeting_url)
-    if merged_description is not None:
-      event_body["description"] = merged_description
-    attendees_value = _build_gcal_attendees(attendees)
-    if attendees_value is not None:
-      event_body["attendees"] = attendees_value
-    reminders_value = _build_gcal_reminders(reminders)
-    if reminders_value is not None:
-      event_body["reminders"] = reminders_value
-    visibility_value = _normalize_visibility(visibility)
-    if visibility_value is not None:
-      event_body["visibility"] = visibility_value
-    transparency_value = _normalize_transparency(transparency)
-    if transparency_value is not None:
-      event_body["transparency"] = transparency_value
-    color_value = _normalize_color_id(color_id)
-    if color_value is not None:
-      event_body["colorId"] = color_value
-
-    if all_day:
-      start_date_str2 = start_date.strftime("%Y-%m-%d")
-      end_date_excl = (start_date + timedelta(days=1)).strftime("%Y-%m-%d")
-      event_body["start"] = {"date": start_date_str2}
-      event_body["end"] = {"date": end_date_excl}
-    else:
-      hh, mm = [int(x) for x in time_str.strip().split(":")]
-      start_dt = datetime(start_date.year,
-                          start_date.month,
-                          start_date.day,
-                          hh,
-                          mm,
-                          tzinfo=SEOUL)
-      if duration_minutes and isinstance(
-          duration_minutes, (int, float)) and duration_minutes > 0:
-        end_dt = start_dt + timedelta(minutes=int(duration_minutes))
-      else:
-        end_dt = start_dt + timedelta(hours=1)
-
-      event_body["start"] = {
-          "dateTime": start_dt.isoformat(),
-          "timeZone": timezone_value
-      }
-      event_body["end"] = {
-          "dateTime": end_dt.isoformat(),
-          "timeZone": timezone_value
-      }
-
-    if location:
-      event_body["location"] = (location or "").strip() or None
-
     _log_debug(f"[GCAL] create recurring event body: recurrence={event_body.get('recurrence')}, "
                f"start={event_body.get('start')}, end={event_body.get('end')}, "
                f"summary={event_body.get('summary')}")
@@ -1518,6 +1683,25 @@ def gcal_delete_event(event_id: str,
 #  Batch API helpers
 # ---------------------------------------------------------------------------
 
+def _optional_event_fields(description: Optional[str],
+                           meeting_url: Optional[str],
+                           attendees: Optional[List[str]],
+                           reminders: Optional[List[int]],
+                           visibility: Optional[str],
+                           transparency: Optional[str],
+                           color_id: Optional[str]) -> Dict[str, Any]:
+  """Optional body fields shared by the create builders; unset values are omitted."""
+  optional = {
+      "description": _merge_description(description, meeting_url),
+      "attendees": _build_gcal_attendees(attendees),
+      "reminders": _build_gcal_reminders(reminders),
+      "visibility": _normalize_visibility(visibility),
+      "transparency": _normalize_transparency(transparency),
+      "colorId": _normalize_color_id(color_id),
+  }
+  return {key: value for key, value in optional.items() if value is not None}
+
+
 def _build_single_event_body(
     title: str,
     start_iso: str,
@@ -1535,34 +1719,20 @@ def _build_single_event_body(
 ) -> Dict[str, Any]:
   """Build a Google Calendar event body dict for a single event (no API call)."""
   use_all_day = bool(all_day)
-  event_body: Dict[str, Any] = {"summary": title}
-  merged_description = _merge_description(description, meeting_url)
-  if merged_description is not None:
-    event_body["description"] = merged_description
-  attendees_value = _build_gcal_attendees(attendees)
-  if attendees_value is not None:
-    event_body["attendees"] = attendees_value
-  reminders_value = _build_gcal_reminders(reminders)
-  if reminders_value is not None:
-    event_body["reminders"] = reminders_value
-  visibility_value = _normalize_visibility(visibility)
-  if visibility_value is not None:
-    event_body["visibility"] = visibility_value
-  transparency_value = _normalize_transparency(transparency)
-  if transparency_value is not None:
-    event_body["transparency"] = transparency_value
-  color_value = _normalize_color_id(color_id)
-  if color_value is not None:
-    event_body["colorId"] = color_value
+  event_body: Dict[str, Any] = {
+      "summary": title,
+      **_optional_event_fields(description, meeting_url, attendees, reminders,
+                               visibility, transparency, color_id),
+  }
 
   if use_all_day:
     start_date_obj, end_exclusive = _compute_all_day_bounds(start_iso, end_iso)
-    event_body["start"] = {"date": start_date_obj.strftime("%Y-%m-%d")}
-    event_body["end"] = {"date": end_exclusive.strftime("%Y-%m-%d")}
+    event_body["start"] = {"date": start_date_obj.isoformat()}
+    event_body["end"] = {"date": end_exclusive.isoformat()}
   else:
-    start_dt = datetime.strptime(start_iso, "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
+    start_dt = _parse_iso_minute(start_iso, SEOUL)
     if end_iso:
-      end_dt = datetime.strptime(end_iso, "%Y-%m-%dT%H:%M").replace(tzinfo=SEOUL)
+      end_dt = _parse_iso_minute(end_iso, SEOUL)
     else:
       end_dt = start_dt + timedelta(hours=1)
     tz_value = timezone_value or "Asia/Seoul"
@@ -1604,40 +1774,24 @@ def _build_recurring_event_body(
   if not isinstance(start_date_str, str):
     return None
   try:
-    start_date_obj = datetime.strptime(start_date_str, "%Y-%m-%d").date()
+    start_date_obj = date.fromisoformat(start_date_str)
   except Exception:
     return None
 
   start_date_obj = _align_start_to_byday(start_date_obj, rrule_core)
   all_day = not (isinstance(time_str, str)
-                 and re.match(r"^\d{2}:\d{2}$", time_str.strip()))
+                 and HHMM_RE.fullmatch(time_str.strip()))
 
   event_body: Dict[str, Any] = {
       "summary": title,
       "recurrence": [f"RRULE:{rrule_core}"],
+      **_optional_event_fields(description, meeting_url, attendees, reminders,
+                               visibility, transparency, color_id),
   }
-  merged_description = _merge_description(description, meeting_url)
-  if merged_description is not None:
-    event_body["description"] = merged_description
-  attendees_value = _build_gcal_attendees(attendees)
-  if attendees_value is not None:
-    event_body["attendees"] = attendees_value
-  reminders_value = _build_gcal_reminders(reminders)
-  if reminders_value is not None:
-    event_body["reminders"] = reminders_value
-  visibility_value = _normalize_visibility(visibility)
-  if visibility_value is not None:
-    event_body["visibility"] = visibility_value
-  transparency_value = _normalize_transparency(transparency)
-  if transparency_value is not None:
-    event_body["transparency"] = transparency_value
-  color_value = _normalize_color_id(color_id)
-  if color_value is not None:
-    event_body["colorId"] = color_value
 
   if all_day:
-    event_body["start"] = {"date": start_date_obj.strftime("%Y-%m-%d")}
-    end_date_excl = (start_date_obj + timedelta(days=1)).strftime("%Y-%m-%d")
+    event_body["start"] = {"date": start_date_obj.isoformat()}
+    end_date_excl = (start_date_obj + timedelta(days=1)).isoformat()
     event_body["end"] = {"date": end_date_excl}
   else:
     hh, mm = [int(x) for x in time_str.strip().split(":")]
@@ -1655,6 +1809,39 @@ def _build_recurring_event_body(
   return event_body
 
 
+_GOOGLE_BATCH_LIMIT = 50
+
+
+def _execute_google_batch(service, pending: List[Tuple[str, Any, Any]]) -> None:
+  """(request_id, request, callback) 목록을 Google batch 한도(50개)씩 나눠 실행한다.
+
+  batch가 여러 개면 서로 독립적이므로 _google_io_executor에서 동시에 보낸다.
+  httplib2 연결은 스레드 간에 공유할 수 없어서 batch마다 별도의 AuthorizedHttp를 쓴다.
+  """
+  chunks = [
+      pending[offset:offset + _GOOGLE_BATCH_LIMIT]
+      for offset in range(0, len(pending), _GOOGLE_BATCH_LIMIT)
+  ]
+  credentials = getattr(chunks[0][0][1].http, "credentials", None) if chunks else None
+  if len(chunks) <= 1 or credentials is None:
+    for chunk in chunks:
+      _execute_google_batch_chunk(service, chunk)
+    return
+  list(_google_io_executor.map(
+      lambda chunk: _execute_google_batch_chunk(
+          service, chunk, AuthorizedHttp(credentials, http=httplib2.Http())),
+      chunks))
+
+
+def _execute_google_batch_chunk(service,
+                                chunk: List[Tuple[str, Any, Any]],
+                                http: Any = None) -> None:
+  batch = service.new_batch_http_request()
+  for request_id, req, callback in chunk:
+    batch.add(req, callback=callback, request_id=request_id)
+  batch.execute(http=http)
+
+
 def gcal_batch_insert_events(
     bodies: List[Dict[str, Any]],
     session_id: str,
@@ -1688,11 +1875,12 @@ def gcal_batch_insert_events(
         errors.append(f"items[{index}]: missing event id in response")
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
+  events_resource = service.events()
   for idx, body in enumerate(bodies):
-    req = service.events().insert(calendarId=resolved_cal, body=body)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
-  batch.execute()
+    req = events_resource.insert(calendarId=resolved_cal, body=body)
+    pending.append((str(idx), req, _callback(idx)))
+  _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] batch insert errors: {errors}")
@@ -1728,14 +1916,16 @@ def gcal_batch_update_events(
       results[index] = True
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
+  events_resource = service.events()
+  default_calendar_id = GOOGLE_CALENDAR_ID
   for idx, entry in enumerate(updates):
     raw_event_id = entry["event_id"]
-    cal_id = entry.get("calendar_id") or GOOGLE_CALENDAR_ID
+    cal_id = entry.get("calendar_id") or default_calendar_id
     body = entry["body"]
-    req = service.events().patch(calendarId=cal_id, eventId=raw_event_id, body=body)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
-  batch.execute()
+    req = events_resource.patch(calendarId=cal_id, eventId=raw_event_id, body=body)
+    pending.append((str(idx), req, _callback(idx)))
+  _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] batch update errors: {errors}")
@@ -1782,11 +1972,12 @@ def gcal_batch_delete_events(
       results[index] = True
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
+  events_resource = service.events()
   for idx, (raw_id, cal_id) in enumerate(parsed):
-    req = service.events().delete(calendarId=cal_id, eventId=raw_id)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
-  batch.execute()
+    req = events_resource.delete(calendarId=cal_id, eventId=raw_id)
+    pending.append((str(idx), req, _callback(idx)))
+  _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] batch delete errors: {errors}")
@@ -1829,14 +2020,15 @@ def gcal_batch_insert_tasks(
         errors.append(f"items[{index}]: missing task response")
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
   request_count = 0
+  tasks_resource = service.tasks()
   for idx, body in enumerate(bodies):
-    req = service.tasks().insert(tasklist=tasklist, body=body)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
+    req = tasks_resource.insert(tasklist=tasklist, body=body)
+    pending.append((str(idx), req, _callback(idx)))
     request_count += 1
   if request_count > 0:
-    batch.execute()
+    _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] task batch insert errors: {errors}")
@@ -1885,19 +2077,20 @@ def gcal_batch_patch_tasks(
         errors.append(f"items[{index}]: missing task response")
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
   request_count = 0
+  tasks_resource = service.tasks()
   for idx, entry in enumerate(updates):
     task_id = str(entry.get("task_id") or "").strip()
     body = entry.get("body")
     if not task_id or not isinstance(body, dict):
       errors.append(f"items[{idx}]: task_id/body is invalid")
       continue
-    req = service.tasks().patch(tasklist=tasklist, task=task_id, body=body)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
+    req = tasks_resource.patch(tasklist=tasklist, task=task_id, body=body)
+    pending.append((str(idx), req, _callback(idx)))
     request_count += 1
   if request_count > 0:
-    batch.execute()
+    _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] task batch patch errors: {errors}")
@@ -1948,18 +2141,19 @@ def gcal_batch_delete_tasks(
       results[index] = True
     return _inner
 
-  batch = service.new_batch_http_request()
+  pending: List[Tuple[str, Any, Any]] = []
   request_count = 0
+  tasks_resource = service.tasks()
   for idx, task_id in enumerate(task_ids):
     clean_id = str(task_id or "").strip()
     if not clean_id:
       errors.append(f"items[{idx}]: task_id is empty")
       continue
-    req = service.tasks().delete(tasklist=tasklist, task=clean_id)
-    batch.add(req, callback=_callback(idx), request_id=str(idx))
+    req = tasks_resource.delete(tasklist=tasklist, task=clean_id)
+    pending.append((str(idx), req, _callback(idx)))
     request_count += 1
   if request_count > 0:
-    batch.execute()
+    _execute_google_batch(service, pending)
 
   if errors:
     _log_debug(f"[GCAL] task batch delete errors: {errors}")
@@ -1987,23 +2181,23 @@ def _convert_gcal_time(obj: Dict[str, Any],
   dt_value = obj.get("dateTime")
   if isinstance(dt_value, str):
     try:
-      dt = datetime.fromisoformat(dt_value.replace("Z", "+00:00"))
+      if ciso8601 is not None:
+        dt = ciso8601.parse_datetime(dt_value)
+      else:
+        dt = datetime.fromisoformat(dt_value)
       dt = dt.astimezone(SEOUL)
-      return (dt.strftime("%Y-%m-%dT%H:%M"), False)
+      return (dt.isoformat(timespec="minutes")[:16], False)
     except Exception:
       return (None, False)
 
   date_value = obj.get("date")
   if isinstance(date_value, str):
     try:
-      date_obj = datetime.strptime(date_value, "%Y-%m-%d").date()
-    except Exception:
+      date_obj = date.fromisoformat(date_value)
+    except ValueError:
       return (None, True)
 
-    if not is_end:
-      return (date_obj.strftime("%Y-%m-%dT00:00"), True)
-
-    return (date_obj.strftime("%Y-%m-%dT00:00"), True)
+    return (f"{date_obj.isoformat()}T00:00", True)
 
   return (None, False)
 
@@ -2061,8 +2255,8 @@ def _cache_covers_range(cache_entry: Dict[str, Any],
 
 def _cache_events_map(cache_entry: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
   events = cache_entry.get("events")
-  if not isinstance(events, dict):
-    events = {}
+  if not isinstance(events, _SortedEventMap):
+    events = _SortedEventMap(events if isinstance(events, dict) else {})
     cache_entry["events"] = events
   return events
 
@@ -2086,33 +2280,91 @@ def _cached_events_for_range(cache_entry: Dict[str, Any],
                              range_start: date,
                              range_end: date) -> List[Dict[str, Any]]:
   range_start, range_end = _normalize_range(range_start, range_end)
-  events = _cache_events_map(cache_entry)
-  items: List[Dict[str, Any]] = []
-  for event in events.values():
-    if not isinstance(event, dict):
-      continue
-    if _event_in_date_range(event, range_start, range_end):
-      items.append(event)
-  items.sort(key=lambda ev: ev.get("start") or "")
-  return items
+  ordered = _cache_events_map(cache_entry).sorted_values()
+  # Nothing starting on or after the day after range_end can overlap the range.
+  cutoff = bisect_left(ordered,
+                       (range_end + timedelta(days=1)).isoformat(),
+                       key=_event_start_key)
+  range_start_iso, range_end_iso = range_start.isoformat(), range_end.isoformat()
+  return [
+      event for event in ordered[:cutoff]
+      if isinstance(event, dict)
+      and _event_in_date_range(event, range_start_iso, range_end_iso)
+  ]
 
 
 def _event_in_date_range(ev: Dict[str, Any],
-                         range_start: date,
-                         range_end: date) -> bool:
-  start_date, _ = _split_iso_date_time(ev.get("start"))
-  if not start_date:
-    return False
-  end_date, _ = _split_iso_date_time(ev.get("end"))
-  if not end_date:
-    end_date = start_date
-  if end_date < range_start or start_date > range_end:
+                         range_start: Union[date, str],
+                         range_end: Union[date, str]) -> bool:
+  """Overlap check on YYYY-MM-DD prefixes; ISO dates order lexicographically.
+
+  Hot loops pass range bounds already converted with isoformat().
+  """
+  start = ev.get("start")
+  if not isinstance(start, str) or len(start) < 10:
     return False
-  return True
+  start_day = start[:10]
+  end = ev.get("end")
+  end_day = end[:10] if isinstance(end, str) and len(end) >= 10 else start_day
+  if not isinstance(range_start, str):
+    range_start = range_start.isoformat()
+  if not isinstance(range_end, str):
+    range_end = range_end.isoformat()
+  return not (end_day < range_start or start_day > range_end)
+
+
+def _reminder_minutes(value: Any) -> Optional[int]:
+  try:
+    minutes = int(value)
+  except Exception:
+    return None
+  return minutes if minutes >= 0 else None
+
+
+# Google bumps "updated" whenever an event body changes, so (session, calendar,
+# id, updated) identifies one normalized result across repeated fetches.
+# "primary" 같은 캘린더 id는 사용자마다 같고 알림/색상은 사용자별 값이라 세션 키를 함께 쓴다.
+_normalized_event_cache: Dict[Tuple[str, Optional[str], str, str], Dict[str, Any]] = _LRUCache(4096)
+# 반복 일정 인스턴스처럼 같은 참석자/알림 목록이 많아 캐시 항목끼리 튜플 하나를 나눠 쓴다.
+_shared_field_values: Dict[tuple, tuple] = _LRUCache(1024)
+
+
+def _share_field_values(values: Optional[List[Any]]) -> Optional[tuple]:
+  if values is None:
+    return None
+  key = tuple(sys.intern(v) if isinstance(v, str) else v for v in values)
+  shared = _shared_field_values.get(key)
+  if shared is None:
+    _shared_field_values[key] = shared = key
+  return shared
 
 
 def _normalize_gcal_event(raw: Dict[str, Any],
-                          calendar_id: Optional[str]) -> Optional[Dict[str, Any]]:
+                          calendar_id: Optional[str],
+                          session_id: Optional[str] = None) -> Optional[Dict[str, Any]]:
+  event_id = raw.get("id")
+  updated = raw.get("updated")
+  if not session_id or not isinstance(event_id, str) or not isinstance(updated, str):
+    return _build_normalized_gcal_event(raw, calendar_id)
+  cache_key = (_session_key(session_id), calendar_id, event_id, updated)
+  cached = _normalized_event_cache.get(cache_key)
+  if cached is None:
+    cached = _build_normalized_gcal_event(raw, calendar_id)
+    if cached is None:
+      return None
+    for field in ("attendees", "reminders"):
+      cached[field] = _share_field_values(cached[field])
+    _normalized_event_cache[cache_key] = cached
+  # Callers own (and may mutate) the returned dict and its lists.
+  result = dict(cached)
+  for field in ("attendees", "reminders"):
+    if result[field] is not None:
+      result[field] = list(result[field])
+  return result
+
+
+def _build_normalized_gcal_event(raw: Dict[str, Any],
+                                 calendar_id: Optional[str]) -> Optional[Dict[str, Any]]:
   start_raw = raw.get("start") or {}
   start_iso, all_day_flag = _convert_gcal_time(start_raw, False, None)
   if not start_iso:
@@ -2122,44 +2374,30 @@ def _normalize_gcal_event(raw: Dict[str, Any],
   attendees_raw = raw.get("attendees")
   attendees: Optional[List[str]] = None
   if isinstance(attendees_raw, list):
-    cleaned_attendees: List[str] = []
-    for item in attendees_raw:
-      if not isinstance(item, dict):
-        continue
-      email = item.get("email")
-      if isinstance(email, str) and email.strip():
-        cleaned_attendees.append(email.strip())
-    attendees = cleaned_attendees or None
+    attendees = [
+        cleaned for item in attendees_raw
+        if isinstance(item, dict) and isinstance(email := item.get("email"), str)
+        and (cleaned := email.strip())
+    ] or None
 
   reminders: Optional[List[int]] = None
-  reminders_raw = raw.get("reminders") or {}
-  overrides = reminders_raw.get("overrides")
+  overrides = (raw.get("reminders") or {}).get("overrides")
   if isinstance(overrides, list):
-    cleaned_reminders: List[int] = []
-    for item in overrides:
-      if not isinstance(item, dict):
-        continue
-      minutes = item.get("minutes")
-      try:
-        minutes_value = int(minutes)
-      except Exception:
-        continue
-      if minutes_value >= 0:
-        cleaned_reminders.append(minutes_value)
-    reminders = cleaned_reminders or None
+    reminders = [
+        minutes for item in overrides
+        if isinstance(item, dict)
+        and (minutes := _reminder_minutes(item.get("minutes"))) is not None
+    ] or None
 
   meeting_url = raw.get("hangoutLink")
   if not meeting_url:
-    conference = raw.get("conferenceData") or {}
-    entry_points = conference.get("entryPoints")
+    entry_points = (raw.get("conferenceData") or {}).get("entryPoints")
     if isinstance(entry_points, list):
-      for entry in entry_points:
-        if not isinstance(entry, dict):
-          continue
-        uri = entry.get("uri")
-        if isinstance(uri, str) and uri.strip():
-          meeting_url = uri.strip()
-          break
+      meeting_url = next(
+          (uri.strip() for entry in entry_points
+           if isinstance(entry, dict) and isinstance(uri := entry.get("uri"), str)
+           and uri.strip()),
+          meeting_url)
 
   timezone_value = None
   if isinstance(start_raw, dict):
@@ -2201,9 +2439,9 @@ def _normalize_gcal_event(raw: Dict[str, Any],
 
 
 def _sorted_google_cache_items(cache: Dict[str, Dict[str, Any]]) -> List[Dict[str, Any]]:
-  items = list(cache.values())
-  items.sort(key=lambda ev: ev.get("start") or "")
-  return items
+  if isinstance(cache, _SortedEventMap):
+    return list(cache.sorted_values())
+  return sorted(cache.values(), key=_event_start_key)
 
 
 def _sync_token_error_kind(exc: Exception) -> Optional[str]:
@@ -2232,42 +2470,43 @@ def _fetch_google_events_raw(service,
                              max_results: Optional[int] = None,
                              order_by: Optional[str] = None
                              ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
-  time_min = datetime(range_start.year,
-                      range_start.month,
-                      range_start.day,
-                      0,
-                      0,
-                      tzinfo=SEOUL)
-  time_max = datetime(range_end.year,
-                      range_end.month,
-                      range_end.day,
-                      0,
-                      0,
-                      tzinfo=SEOUL) + timedelta(days=1)
+  # Everything except pageToken is invariant across pages, so the params dict
+  # is built once and only the page token is swapped inside the loop.
+  params: Dict[str, Any] = {
+      "calendarId": calendar_id,
+      "singleEvents": True,
+      "fields": _GCAL_EVENT_LIST_FIELDS,
+  }
+  if sync_token:
+    params["syncToken"] = sync_token
+    params["showDeleted"] = True
+  else:
+    time_min = datetime(range_start.year,
+                        range_start.month,
+                        range_start.day,
+                        tzinfo=SEOUL)
+    time_max = datetime(range_end.year,
+                        range_end.month,
+                        range_end.day,
+                        tzinfo=SEOUL) + timedelta(days=1)
+    params["timeMin"] = time_min.isoformat()
+    params["timeMax"] = time_max.isoformat()
+    if query:
+      params["q"] = query
+    if isinstance(max_results, int) and max_results > 0:
+      params["maxResults"] = max_results
+    # orderBy suppresses nextSyncToken, so cache fetches leave it unset.
+    if order_by:
+      params["orderBy"] = order_by
 
   events_data: List[Dict[str, Any]] = []
   page_token: Optional[str] = None
   next_sync_token: Optional[str] = None
+  events_resource = service.events()
 
   while True:
-    params: Dict[str, Any] = {
-        "calendarId": calendar_id,
-        "singleEvents": True,
-        "pageToken": page_token,
-    }
-    if sync_token:
-      params["syncToken"] = sync_token
-      params["showDeleted"] = True
-    else:
-      params["timeMin"] = time_min.isoformat()
-      params["timeMax"] = time_max.isoformat()
-      if query:
-        params["q"] = query
-      if isinstance(max_results, int) and max_results > 0:
-        params["maxResults"] = max_results
-      params["orderBy"] = order_by or "startTime"
-
-    request = service.events().list(**params)
+    params["pageToken"] = page_token
+    request = events_resource.list(**params)
     try:
       response = request.execute()
     except HttpError as exc:
@@ -2289,20 +2528,60 @@ def _fetch_google_events_raw(service,
   return events_data, next_sync_token
 
 
+# Partial responses: only the fields _normalize_gcal_event reads.
+_GCAL_EVENT_FIELDS = ("id,summary,start,end,location,description,attendees(email),"
+                      "reminders(overrides(minutes)),visibility,transparency,hangoutLink,"
+                      "conferenceData(entryPoints(uri)),colorId,recurringEventId,recurrence,"
+                      "status,htmlLink,organizer(email),created,updated")
+_GCAL_EVENT_LIST_FIELDS = f"nextPageToken,nextSyncToken,items({_GCAL_EVENT_FIELDS})"
+_GCAL_RECENT_LIST_FIELDS = ("nextPageToken,items(id,summary,start,end,location,status,"
+                            "htmlLink,organizer(email),created,updated)")
+
+
+def _raw_event_day(value: Any) -> str:
+  if not isinstance(value, dict):
+    return ""
+  raw = value.get("dateTime") or value.get("date")
+  return raw[:10] if isinstance(raw, str) and len(raw) >= 10 else ""
+
+
+def _raw_event_outside(raw: Dict[str, Any], lower_iso: str, upper_iso: str) -> bool:
+  """Cheap pre-check on the raw Google payload before full normalization.
+
+  Bounds are padded by a day by the caller since raw dateTime values may carry
+  a non-Seoul offset.
+  """
+  start_day = _raw_event_day(raw.get("start"))
+  if start_day and start_day > upper_iso:
+    return True
+  end_day = _raw_event_day(raw.get("end"))
+  return bool(end_day) and end_day < lower_iso
+
+
+def _padded_range_iso(range_start: date, range_end: date) -> Tuple[str, str]:
+  return ((range_start - timedelta(days=1)).isoformat(),
+          (range_end + timedelta(days=1)).isoformat())
+
+
 def _normalize_gcal_items(raw_items: List[Dict[str, Any]],
                           range_start: date,
                           range_end: date,
-                          calendar_id: Optional[str]) -> List[Dict[str, Any]]:
+                          calendar_id: Optional[str],
+                          session_id: Optional[str] = None) -> List[Dict[str, Any]]:
   items: List[Dict[str, Any]] = []
+  range_start_iso, range_end_iso = range_start.isoformat(), range_end.isoformat()
+  lower_iso, upper_iso = _padded_range_iso(range_start, range_end)
   for raw in raw_items:
     if not isinstance(raw, dict):
       continue
     if raw.get("status") == "cancelled":
       continue
-    normalized = _normalize_gcal_event(raw, calendar_id)
+    if _raw_event_outside(raw, lower_iso, upper_iso):
+      continue
+    normalized = _normalize_gcal_event(raw, calendar_id, session_id)
     if not normalized:
       continue
-    if _event_in_date_range(normalized, range_start, range_end):
+    if _event_in_date_range(normalized, range_start_iso, range_end_iso):
       items.append(normalized)
   return items
 
@@ -2442,9 +2721,12 @@ def fetch_google_event_by_id(session_id: str,
   if not candidate_calendars:
     candidate_calendars.append(GOOGLE_CALENDAR_ID)
 
+  events_resource = service.events()
   for cal_id in candidate_calendars:
     try:
-      raw = service.events().get(calendarId=cal_id, eventId=raw_event_id).execute()
+      raw = events_resource.get(calendarId=cal_id,
+                                eventId=raw_event_id,
+                                fields=_GCAL_EVENT_FIELDS).execute()
     except HttpError as exc:
       status = getattr(exc.resp, "status", None)
       if status in (404, 410):
@@ -2454,7 +2736,7 @@ def fetch_google_event_by_id(session_id: str,
       continue
     if raw.get("status") == "cancelled":
       return None
-    normalized = _normalize_gcal_event(raw, cal_id)
+    normalized = _normalize_gcal_event(raw, cal_id, session_id)
     if normalized:
       return normalized
   return None
@@ -2463,19 +2745,56 @@ def fetch_google_event_by_id(session_id: str,
 def sync_google_event_after_write(session_id: str,
                                   event_id: str,
                                   calendar_id: Optional[str] = None,
-                                  emit_sse: bool = True) -> Dict[str, Any]:
+                                  emit_sse: bool = True,
+                                  latest: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+  """쓰기 직후 캐시/SSE를 맞춘다. 쓰기 응답으로 받은 이벤트(latest)가 있으면 다시 조회하지 않는다."""
   if not session_id or not event_id:
     return {
         "event": None,
         "new_revision": 0,
         "op_id": None,
     }
-  context_key = _context_cache_key_for_session_mode(session_id, True)
+  if latest is None:
+    latest = _fetch_google_event_quietly(session_id, event_id, calendar_id)
+  return _apply_google_event_after_write(session_id, latest, calendar_id, emit_sse)
+
+
+def sync_google_events_after_write(session_id: str,
+                                   event_ids: List[str],
+                                   calendar_id: Optional[str] = None,
+                                   emit_sse: bool = True) -> List[Dict[str, Any]]:
+  """Re-fetch several written events concurrently, then apply them in order."""
+  if not session_id or len(event_ids) <= 1:
+    return [
+        sync_google_event_after_write(session_id, eid, calendar_id, emit_sse)
+        for eid in event_ids
+    ]
+  latest_items = list(
+      _google_io_executor.map(
+          lambda eid: _fetch_google_event_quietly(session_id, eid, calendar_id),
+          event_ids))
+  return [
+      _apply_google_event_after_write(session_id, latest, calendar_id, emit_sse)
+      for latest in latest_items
+  ]
+
+
+def _fetch_google_event_quietly(session_id: str,
+                                event_id: str,
+                                calendar_id: Optional[str]) -> Optional[Dict[str, Any]]:
+  if not event_id:
+    return None
   try:
-    latest = fetch_google_event_by_id(session_id, event_id, calendar_id=calendar_id)
+    return fetch_google_event_by_id(session_id, event_id, calendar_id=calendar_id)
   except Exception:
-    latest = None
+    return None
+
 
+def _apply_google_event_after_write(session_id: str,
+                                    latest: Optional[Dict[str, Any]],
+                                    calendar_id: Optional[str],
+                                    emit_sse: bool) -> Dict[str, Any]:
+  context_key = _context_cache_key_for_session_mode(session_id, True)
   if isinstance(latest, dict):
     # If the fetched event is a recurring series master (has recur but no
     # recurring_event_id), it must NOT be upserted into the session cache
@@ -2648,8 +2967,10 @@ def fetch_google_events_between_with_options(
                                             range_end,
                                             cal_id,
                                             query=query,
-                                            max_results=max_results)
-    items.extend(_normalize_gcal_items(raw_items, range_start, range_end, cal_id))
+                                            max_results=max_results,
+                                            order_by="startTime")
+    items.extend(_normalize_gcal_items(raw_items, range_start, range_end, cal_id,
+                                       session_id))
     if max_results and len(items) >= max_results:
       break
 
@@ -2667,7 +2988,13 @@ def _apply_gcal_items_to_cache(cache: Dict[str, Dict[str, Any]],
                                raw_items: List[Dict[str, Any]],
                                range_start: date,
                                range_end: date,
-                               calendar_id: Optional[str]) -> None:
+                               calendar_id: Optional[str],
+                               session_id: Optional[str] = None) -> None:
+  range_start_iso, range_end_iso = range_start.isoformat(), range_end.isoformat()
+  lower_iso, upper_iso = _padded_range_iso(range_start, range_end)
+  # Collect changes first and apply them in bulk; the last entry for a key wins.
+  updates: Dict[str, Dict[str, Any]] = {}
+  deletes: set[str] = set()
   for raw in raw_items:
     if not isinstance(raw, dict):
       continue
@@ -2675,16 +3002,22 @@ def _apply_gcal_items_to_cache(cache: Dict[str, Dict[str, Any]],
     if not event_id:
       continue
     cache_key = f"{calendar_id}::{event_id}" if calendar_id else event_id
-    if raw.get("status") == "cancelled":
-      cache.pop(cache_key, None)
-      continue
-    normalized = _normalize_gcal_event(raw, calendar_id)
-    if not normalized:
-      continue
-    if _event_in_date_range(normalized, range_start, range_end):
-      cache[cache_key] = normalized
+    normalized = None
+    if raw.get("status") != "cancelled" and not _raw_event_outside(raw, lower_iso, upper_iso):
+      normalized = _normalize_gcal_event(raw, calendar_id, session_id)
+      if not normalized:
+        continue
+    if normalized and _event_in_date_range(normalized, range_start_iso, range_end_iso):
+      updates[cache_key] = normalized
+      deletes.discard(cache_key)
     else:
-      cache.pop(cache_key, None)
+      updates.pop(cache_key, None)
+      deletes.add(cache_key)
+
+  for cache_key in deletes:
+    cache.pop(cache_key, None)
+  if updates:
+    cache.update(updates)
 
 
 def _reset_gcal_cache_range(cache: Dict[str, Dict[str, Any]],
@@ -2694,12 +3027,13 @@ def _reset_gcal_cache_range(cache: Dict[str, Dict[str, Any]],
   if not calendar_id:
     return
   prefix = f"{calendar_id}::"
+  range_start_iso, range_end_iso = range_start.isoformat(), range_end.isoformat()
   for key, event in list(cache.items()):
     if not isinstance(key, str) or not key.startswith(prefix):
       continue
     if not isinstance(event, dict):
       continue
-    if _event_in_date_range(event, range_start, range_end):
+    if _event_in_date_range(event, range_start_iso, range_end_iso):
       cache.pop(key, None)
 
 
@@ -2728,9 +3062,15 @@ def _refresh_event_cache_slice(service,
                                cache_entry: Dict[str, Any],
                                calendar_ids: List[str],
                                range_start: date,
-                               range_end: date) -> None:
+                               range_end: date,
+                               session_id: Optional[str] = None) -> None:
   cache_events = _cache_events_map(cache_entry)
   calendars_state = _cache_calendars_state(cache_entry)
+  coverage_start, coverage_end = _cache_coverage(cache_entry)
+  # A sync token only tracks the window it was issued for; keep it only when
+  # this slice spans the whole coverage after the merge.
+  spans_coverage = (coverage_start is None or coverage_end is None
+                    or (range_start <= coverage_start and range_end >= coverage_end))
   for calendar_id in calendar_ids:
     raw_items, next_sync = _fetch_google_events_raw(service,
                                                     range_start,
@@ -2738,14 +3078,56 @@ def _refresh_event_cache_slice(service,
                                                     calendar_id)
     _reset_gcal_cache_range(cache_events, range_start, range_end, calendar_id)
     _apply_gcal_items_to_cache(cache_events, raw_items, range_start, range_end,
-                               calendar_id)
+                               calendar_id, session_id)
     calendars_state[calendar_id] = {
-        "sync_token": next_sync,
+        "sync_token": next_sync if spans_coverage else None,
         "sync_disabled": False,
     }
   _set_cache_coverage(cache_entry, range_start, range_end)
 
 
+def _sync_event_cache_incremental(service,
+                                  cache_entry: Dict[str, Any],
+                                  calendar_ids: List[str],
+                                  session_id: Optional[str] = None) -> bool:
+  """Apply syncToken deltas over the cached coverage.
+
+  Returns False when any calendar lacks a usable token, so the caller falls
+  back to a full list fetch.
+  """
+  coverage_start, coverage_end = _cache_coverage(cache_entry)
+  if coverage_start is None or coverage_end is None:
+    return False
+  calendars_state = _cache_calendars_state(cache_entry)
+  for calendar_id in calendar_ids:
+    state = calendars_state.get(calendar_id) or {}
+    if not state.get("sync_token") or state.get("sync_disabled"):
+      return False
+
+  cache_events = _cache_events_map(cache_entry)
+  for calendar_id in calendar_ids:
+    state = calendars_state[calendar_id]
+    try:
+      raw_items, next_sync = _fetch_google_events_raw(service,
+                                                      coverage_start,
+                                                      coverage_end,
+                                                      calendar_id,
+                                                      sync_token=state["sync_token"])
+    except SyncTokenInvalid as exc:
+      state["sync_token"] = None
+      if exc.kind == "unsupported":
+        state["sync_disabled"] = True
+      return False
+    _apply_gcal_items_to_cache(cache_events,
+                               raw_items,
+                               coverage_start,
+                               coverage_end,
+                               calendar_id,
+                               session_id)
+    state["sync_token"] = next_sync
+  return True
+
+
 def fetch_google_events_between(range_start: date,
                                 range_end: date,
                                 session_id: str,
@@ -2804,6 +3186,18 @@ def fetch_google_events_between(range_start: date,
     if cached_calendar_id not in active_ids:
       calendars_state.pop(cached_calendar_id, None)
 
+  if force_refresh and _cache_covers_range(cache_entry, range_start, range_end):
+    try:
+      synced = _sync_event_cache_incremental(service, cache_entry, calendar_ids,
+                                             session_id)
+    except Exception as exc:
+      cache_entry["dirty"] = True
+      raise HTTPException(status_code=502,
+                          detail=f"Google Calendar fetch failed: {exc}") from exc
+    if synced:
+      _touch_google_cache(cache_entry, dirty=False)
+      return _cached_events_for_range(cache_entry, range_start, range_end)
+
   coverage_start, coverage_end = _cache_coverage(cache_entry)
   slices_to_fetch: List[Tuple[date, date]] = []
   if force_refresh or coverage_start is None or coverage_end is None:
@@ -2820,7 +3214,8 @@ def fetch_google_events_between(range_start: date,
                                  cache_entry,
                                  calendar_ids,
                                  slice_start,
-                                 slice_end)
+                                 slice_end,
+                                 session_id)
     except Exception as exc:
       cache_entry["dirty"] = True
       raise HTTPException(status_code=502,
@@ -2845,6 +3240,14 @@ def refresh_google_cache_for_calendar(session_id: str,
     _mark_google_cache_dirty(session_id)
     return
 
+  try:
+    if _sync_event_cache_incremental(service, cache_entry, [calendar_id], session_id):
+      _touch_google_cache(cache_entry, dirty=False)
+      return
+  except Exception:
+    cache_entry["dirty"] = True
+    return
+
   cache_events = _cache_events_map(cache_entry)
   calendars_state = _cache_calendars_state(cache_entry)
   try:
@@ -2861,7 +3264,8 @@ def refresh_google_cache_for_calendar(session_id: str,
                              raw_items,
                              coverage_start,
                              coverage_end,
-                             calendar_id)
+                             calendar_id,
+                             session_id)
   calendars_state[calendar_id] = {
       "sync_token": next_sync,
       "sync_disabled": False,
@@ -2869,6 +3273,14 @@ def refresh_google_cache_for_calendar(session_id: str,
   _touch_google_cache(cache_entry, dirty=False)
 
 
+@lru_cache(maxsize=64)
+def _recent_updated_min(days: int, minute_bucket: int) -> str:
+  """updatedMin for the last `days` days; minute granularity is enough, so the
+  value is cached per minute bucket."""
+  time_min = datetime.fromtimestamp(minute_bucket * 60, timezone.utc) - timedelta(days=days)
+  return time_min.strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def fetch_recent_google_events(session_id: str,
                                days: int = GOOGLE_RECENT_DAYS) -> List[Dict[str, Any]]:
   if days <= 0:
@@ -2892,24 +3304,22 @@ def fetch_recent_google_events(session_id: str,
     raise HTTPException(status_code=502,
                         detail=f"Google Calendar 紐⑸줉 議고쉶 ?ㅽ뙣: {exc}") from exc
 
-  now = datetime.now(SEOUL)
-  time_min = now - timedelta(days=days)
-
   events_data: List[Dict[str, Any]] = []
-  updated_min = time_min.astimezone(
-      timezone.utc).isoformat().replace("+00:00", "Z")
+  updated_min = _recent_updated_min(days, int(time.time() // 60))
+  events_resource = service.events()
   for cal in calendars:
     calendar_id = cal.get("id")
     if not isinstance(calendar_id, str) or not calendar_id:
       continue
     page_token: Optional[str] = None
     while True:
-      request = service.events().list(calendarId=calendar_id,
-                                      updatedMin=updated_min,
-                                      singleEvents=True,
-                                      orderBy="updated",
-                                      maxResults=100,
-                                      pageToken=page_token)
+      request = events_resource.list(calendarId=calendar_id,
+                                     updatedMin=updated_min,
+                                     singleEvents=True,
+                                     orderBy="updated",
+                                     maxResults=100,
+                                     pageToken=page_token,
+                                     fields=_GCAL_RECENT_LIST_FIELDS)
       response = request.execute()
       items = response.get("items", [])
 
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import asyncio
+import heapq
 import json
 import re
 import secrets
@@ -11,16 +12,26 @@ from typing import Any, Dict, List, Optional, Tuple
 from fastapi import HTTPException, Request
 from openai import AsyncOpenAI
 
+try:
+  import httpx
+except Exception:  # pragma: no cover - openai normally ships with httpx
+  httpx = None  # type: ignore
+
+try:
+  import orjson  # type: ignore
+except Exception:  # pragma: no cover - optional dependency
+  orjson = None  # type: ignore
+
 from .config import (
     OPENAI_API_KEY,
     LLM_DEBUG,
     SEOUL,
-    ISO_DATE_RE,
     MAX_CONTEXT_DAYS,
     DEFAULT_CONTEXT_DAYS,
     MAX_CONTEXT_EVENTS,
     MAX_CONTEXT_SLICES,
     MAX_CONTEXT_DATES,
+    SPECULATIVE_CONTEXT_PREFETCH,
     ALLOWED_REASONING_EFFORTS,
     ALLOWED_ASSISTANT_MODELS,
     DEFAULT_TEXT_MODEL,
@@ -30,20 +41,51 @@ from .config import (
     USD_TO_KRW,
     MODEL_PRICING,
 )
-from .utils import (_log_debug, normalize_text, _event_within_scope)
+from .utils import (_log_debug, normalize_text, _event_within_scope, _is_iso_date)
 from . import state
 from .gcal import fetch_google_events_between, _get_context_cache, _set_context_cache, _should_use_cached_context
 
-async_client: Optional[AsyncOpenAI] = AsyncOpenAI(api_key=OPENAI_API_KEY) if OPENAI_API_KEY else None
+async_client: Optional[AsyncOpenAI] = None
+_MODEL_PRICING_PER_TOKEN: Dict[str, Dict[str, float]] = {
+    name: {
+        "input_per_tok": pricing["input_per_m"] / 1_000_000,
+        "cached_input_per_tok": pricing["cached_input_per_m"] / 1_000_000,
+        "output_per_tok": pricing["output_per_m"] / 1_000_000,
+    } for name, pricing in MODEL_PRICING.items()
+}
 inflight_tasks: Dict[str, Dict[str, asyncio.Task]] = {}
 inflight_lock = asyncio.Lock()
 
 
+def _build_http_client():
+  if httpx is None:
+    return None
+  return httpx.AsyncClient(
+      limits=httpx.Limits(max_connections=100,
+                          max_keepalive_connections=20,
+                          keepalive_expiry=60),
+      timeout=httpx.Timeout(connect=5, read=60, write=30, pool=5),
+  )
+
+
 def get_async_client() -> AsyncOpenAI:
+  # 프로세스당 하나의 클라이언트를 만들어 api.openai.com 연결을 재사용한다.
+  global async_client
   if async_client is None:
-    raise RuntimeError("OPENAI_API_KEY is not set")
+    if not OPENAI_API_KEY:
+      raise RuntimeError("OPENAI_API_KEY is not set")
+    async_client = AsyncOpenAI(api_key=OPENAI_API_KEY,
+                               http_client=_build_http_client())
   return async_client
 
+
+async def close_async_client() -> None:
+  global async_client
+  client = async_client
+  async_client = None
+  if client is not None:
+    await client.close()
+
 # -------------------------
 # LLM 프롬프트
 # -------------------------
@@ -429,6 +471,16 @@ def build_events_multimodal_prompt_with_context() -> str:
   return EVENTS_MULTIMODAL_PROMPT_WITH_CONTEXT_TEMPLATE
 
 
+def _dumps_json(payload: Any) -> str:
+  """LLM 입력용 JSON 문자열. orjson이 있으면 쓰고, 직렬화할 수 없는 값이 있으면 json으로 돌아간다."""
+  if orjson is not None:
+    try:
+      return orjson.dumps(payload).decode("utf-8")
+    except TypeError:
+      pass
+  return json.dumps(payload, ensure_ascii=False)
+
+
 def _build_events_user_payload(text: str,
                                has_images: bool,
                                context: Optional[Dict[str, Any]] = None
@@ -439,22 +491,21 @@ def _build_events_user_payload(text: str,
         "has_images": bool(has_images),
         "context": context,
     }
-    return json.dumps(payload, ensure_ascii=False)
+    return _dumps_json(payload)
 
-  lines = []
   if text:
-    lines.append(f"문장: {text}")
-  else:
-    lines.append("문장: (제공되지 않음)")
+    if has_images:
+      return f"문장: {text}\n첨부 이미지를 참고해서 일정 정보를 추출해줘."
+    return f"문장: {text}"
   if has_images:
-    lines.append("첨부 이미지를 참고해서 일정 정보를 추출해줘.")
-  return "\n".join(lines)
+    return "문장: (제공되지 않음)\n첨부 이미지를 참고해서 일정 정보를 추출해줘."
+  return "문장: (제공되지 않음)"
 
 
 async def classify_nlp_request(text: str,
                                has_images: bool = False,
                                model_name: Optional[str] = None) -> str:
-  if async_client is None:
+  if not OPENAI_API_KEY:
     raise HTTPException(
         status_code=500,
         detail="LLM client is not configured (OPENAI_API_KEY 미설정)")
@@ -465,7 +516,7 @@ async def classify_nlp_request(text: str,
   }
   data = await _chat_json("classify",
                           REQUEST_CLASSIFY_PROMPT,
-                          json.dumps(payload, ensure_ascii=False),
+                          _dumps_json(payload),
                           reasoning_effort="low",
                           model_name=model_name or "gpt-5-nano")
   value = (data.get("type") or "").strip().lower()
@@ -474,24 +525,32 @@ async def classify_nlp_request(text: str,
   return value
 
 
+_EFFORT_LOOKUP: Dict[str, str] = {
+    effort: effort for effort in ALLOWED_REASONING_EFFORTS
+}
+_MODEL_LOOKUP: Dict[str, str] = {
+    **{model: model for model in ALLOWED_ASSISTANT_MODELS.values()},
+    **ALLOWED_ASSISTANT_MODELS,
+}
+_TRUE_STRINGS = frozenset(("true", "yes", "1"))
+
+
 def _sanitize_reasoning_effort(value: Optional[str]) -> Optional[str]:
-  if not value or not isinstance(value, str):
+  if not isinstance(value, str):
     return None
-  normalized = value.strip().lower()
-  if normalized in ALLOWED_REASONING_EFFORTS:
-    return normalized
-  return None
+  hit = _EFFORT_LOOKUP.get(value)
+  if hit is not None:
+    return hit
+  return _EFFORT_LOOKUP.get(value.strip().lower())
 
 
 def _sanitize_model(value: Optional[str]) -> Optional[str]:
-  if not value or not isinstance(value, str):
+  if not isinstance(value, str):
     return None
-  normalized = value.strip().lower()
-  if normalized in ALLOWED_ASSISTANT_MODELS:
-    return ALLOWED_ASSISTANT_MODELS[normalized]
-  if normalized in ALLOWED_ASSISTANT_MODELS.values():
-    return normalized
-  return None
+  hit = _MODEL_LOOKUP.get(value)
+  if hit is not None:
+    return hit
+  return _MODEL_LOOKUP.get(value.strip().lower())
 
 
 def _resolve_request_reasoning_effort(request: Request,
@@ -513,6 +572,25 @@ def _pick_reasoning_effort(value: Optional[str], default_value: str) -> str:
   return sanitized or default_value
 
 
+# 모델별로 받는 선택 파라미터. 표에 없는 모델에는 보내지 않는다.
+_MODEL_CAPS: Dict[str, frozenset] = {
+    "gpt-5-nano": frozenset(("reasoning_effort", "verbosity")),
+    "gpt-5-mini": frozenset(("reasoning_effort", "verbosity")),
+}
+
+
+def _model_request_kwargs(model: str,
+                          reasoning_effort: str,
+                          verbosity: Optional[str] = None) -> Dict[str, Any]:
+  caps = _MODEL_CAPS.get(model, frozenset())
+  extra: Dict[str, Any] = {}
+  if "reasoning_effort" in caps:
+    extra["reasoning_effort"] = reasoning_effort
+  if verbosity is not None and "verbosity" in caps:
+    extra["verbosity"] = verbosity
+  return extra
+
+
 def _sanitize_context_days(value: Any) -> int:
   try:
     days = int(value)
@@ -530,7 +608,7 @@ def _parse_iso_date(value: Any) -> Optional[date]:
   if len(candidate) < 10:
     return None
   date_part = candidate[:10]
-  if not ISO_DATE_RE.match(date_part):
+  if not _is_iso_date(date_part):
     return None
   try:
     return datetime.strptime(date_part, "%Y-%m-%d").date()
@@ -589,7 +667,7 @@ def _parse_bool(value: Any) -> bool:
   if isinstance(value, (int, float)):
     return value != 0
   if isinstance(value, str):
-    return value.strip().lower() in ("true", "yes", "1")
+    return value in _TRUE_STRINGS or value.strip().lower() in _TRUE_STRINGS
   return False
 
 
@@ -631,6 +709,31 @@ def _extract_context_request(
   return True, [(start_date, end_date)]
 
 
+def _start_context_prefetch(session_id: Optional[str], is_google: bool,
+                            context_confirmed: bool) -> Optional[asyncio.Task]:
+  if not (SPECULATIVE_CONTEXT_PREFETCH and is_google and session_id
+          and context_confirmed):
+    return None
+  today = datetime.now(SEOUL).date()
+  task = asyncio.create_task(
+      asyncio.to_thread(fetch_google_events_between,
+                        today - timedelta(days=DEFAULT_CONTEXT_DAYS),
+                        today + timedelta(days=DEFAULT_CONTEXT_DAYS),
+                        session_id))
+  # 결과는 Google 이벤트 캐시에 남으므로, 쓰지 않더라도 예외만 회수한다.
+  task.add_done_callback(lambda t: t.cancelled() or t.exception())
+  return task
+
+
+async def _await_context_prefetch(task: Optional[asyncio.Task]) -> None:
+  if task is None:
+    return
+  try:
+    await asyncio.shield(task)
+  except Exception as exc:
+    _log_debug("[LLM DEBUG] context prefetch failed: %r", exc)
+
+
 def _build_events_context(scopes: List[Tuple[date, date]],
                           session_id: Optional[str] = None,
                           is_google: bool = False) -> Dict[str, Any]:
@@ -682,8 +785,7 @@ def _build_events_context(scopes: List[Tuple[date, date]],
             "all_day": ev.all_day,
         })
 
-      rec_occurrences = state._collect_local_recurring_occurrences(scope=scope)
-      for occ in rec_occurrences:
+      for occ in state._iter_local_recurring_occurrences(scope=scope):
         id_key = str(occ.id)
         if id_key in seen_ids:
           continue
@@ -698,9 +800,12 @@ def _build_events_context(scopes: List[Tuple[date, date]],
             "all_day": occ.all_day,
         })
 
-  snapshot.sort(key=lambda x: x.get("start") or "")
+  # 상한을 넘으면 전체 정렬 대신 앞쪽 MAX_CONTEXT_EVENTS개만 고른다(sorted(...)[:n]과 같은 결과).
   if len(snapshot) > MAX_CONTEXT_EVENTS:
-    snapshot = snapshot[:MAX_CONTEXT_EVENTS]
+    snapshot = heapq.nsmallest(MAX_CONTEXT_EVENTS, snapshot,
+                               key=lambda x: x.get("start") or "")
+  else:
+    snapshot.sort(key=lambda x: x.get("start") or "")
 
   scope_payload = [
       {
@@ -724,13 +829,23 @@ def _build_events_context(scopes: List[Tuple[date, date]],
   return payload
 
 
-def _get_detail_value(detail: Any, key: str) -> Optional[int]:
+def _details_to_dict(detail: Any) -> Dict[str, Any]:
   if detail is None:
-    return None
+    return {}
   if isinstance(detail, dict):
-    value = detail.get(key)
-  else:
-    value = getattr(detail, key, None)
+    return detail
+  dump = getattr(detail, "model_dump", None)
+  if callable(dump):
+    return dump()
+  return dict(getattr(detail, "__dict__", {}))
+
+
+def _get_detail_value(detail: Dict[str, Any], key: str) -> Optional[int]:
+  value = detail.get(key)
+  if isinstance(value, int):
+    return value
+  if value is None:
+    return None
   try:
     return int(value)
   except (TypeError, ValueError):
@@ -741,7 +856,7 @@ def _estimate_llm_cost(model_name: str, prompt_tokens: Optional[int],
                        cached_prompt_tokens: Optional[int],
                        completion_tokens: Optional[int]) -> Optional[Tuple[float,
                                                                            float]]:
-  pricing = MODEL_PRICING.get(model_name)
+  pricing = _MODEL_PRICING_PER_TOKEN.get(model_name)
   if not pricing:
     return None
 
@@ -751,9 +866,9 @@ def _estimate_llm_cost(model_name: str, prompt_tokens: Optional[int],
   uncached = max(prompt - cached, 0)
   completion = max(int(completion_tokens or 0), 0)
 
-  usd = ((uncached / 1_000_000) * pricing["input_per_m"] +
-         (cached / 1_000_000) * pricing["cached_input_per_m"] +
-         (completion / 1_000_000) * pricing["output_per_m"])
+  usd = (uncached * pricing["input_per_tok"] +
+         cached * pricing["cached_input_per_tok"] +
+         completion * pricing["output_per_tok"])
   krw = usd * USD_TO_KRW
   return usd, krw
 
@@ -769,6 +884,7 @@ async def _invoke_event_parser(kind: str,
                                is_google: bool = False
                                ) -> Dict[str, Any]:
   payload = _build_events_user_payload(text, bool(images))
+  image_parts = _build_image_parts(images)
   cached_context = _get_context_cache(context_cache_key)
   if cached_context and _should_use_cached_context(text):
     payload_with_context = _build_events_user_payload(text, bool(images),
@@ -778,7 +894,7 @@ async def _invoke_event_parser(kind: str,
           kind,
           build_events_multimodal_prompt_with_context(),
           payload_with_context,
-          images,
+          image_parts,
           reasoning_effort=reasoning_effort,
           model_name=model_name)
     else:
@@ -790,11 +906,13 @@ async def _invoke_event_parser(kind: str,
     if isinstance(data, dict):
       data["context_used"] = True
     return data
+  prefetch = _start_context_prefetch(context_session_id, is_google,
+                                     context_confirmed)
   if images:
     data = await _chat_multimodal_json(kind,
                                        build_events_multimodal_prompt(),
                                        payload,
-                                       images,
+                                       image_parts,
                                        reasoning_effort=reasoning_effort,
                                        model_name=model_name)
   else:
@@ -818,6 +936,7 @@ async def _invoke_event_parser(kind: str,
         "context_used": False,
     }
 
+  await _await_context_prefetch(prefetch)
   context = _build_events_context(scopes, session_id=context_session_id, is_google=is_google)
   _set_context_cache(context_cache_key, context)
   payload_with_context = _build_events_user_payload(text, bool(images), context)
@@ -827,7 +946,7 @@ async def _invoke_event_parser(kind: str,
         kind,
         build_events_multimodal_prompt_with_context(),
         payload_with_context,
-        images,
+        image_parts,
         reasoning_effort=reasoning_effort,
         model_name=model_name)
   else:
@@ -888,6 +1007,7 @@ async def _invoke_event_parser_stream(kind: str,
                                       context_confirmed: bool = False,
                                       is_google: bool = False):
   payload = _build_events_user_payload(text, bool(images))
+  image_parts = _build_image_parts(images)
   cached_context = _get_context_cache(context_cache_key)
 
   if cached_context and _should_use_cached_context(text):
@@ -906,7 +1026,7 @@ async def _invoke_event_parser_stream(kind: str,
           kind,
           sys_prompt,
           payload_with_context,
-          images,
+          image_parts,
           reasoning_effort=reasoning_effort,
           model_name=model_name)
       model = _sanitize_model(model_name) or DEFAULT_MULTIMODAL_MODEL
@@ -929,7 +1049,7 @@ async def _invoke_event_parser_stream(kind: str,
         if extracted is not None and len(extracted) > len(prev_extracted_content):
           content_delta = extracted[len(prev_extracted_content):]
           prev_extracted_content = extracted
-          _log_debug(f"[STREAM DEBUG CACHED] content_delta: {content_delta[:50]}...")
+          _log_debug("[STREAM DEBUG CACHED] content_delta: %.50s...", content_delta)
           yield {"type": "content_delta", "content_delta": content_delta}
     
     latency_ms = (time.perf_counter() - started) * 1000.0
@@ -937,6 +1057,8 @@ async def _invoke_event_parser_stream(kind: str,
     return
 
   # 1st Pass: Check context
+  prefetch = _start_context_prefetch(context_session_id, is_google,
+                                     context_confirmed)
   started = time.perf_counter()
   sys_prompt = build_events_system_prompt()
   user_txt = payload
@@ -948,7 +1070,7 @@ async def _invoke_event_parser_stream(kind: str,
         kind,
         sys_prompt,
         payload,
-        images,
+        image_parts,
         reasoning_effort=reasoning_effort,
         model_name=model_name)
     model = _sanitize_model(model_name) or DEFAULT_MULTIMODAL_MODEL
@@ -972,7 +1094,7 @@ async def _invoke_event_parser_stream(kind: str,
       if extracted is not None and len(extracted) > len(prev_extracted_content):
         content_delta = extracted[len(prev_extracted_content):]
         prev_extracted_content = extracted
-        _log_debug(f"[STREAM DEBUG] content_delta: {content_delta[:50]}...")
+        _log_debug("[STREAM DEBUG] content_delta: %.50s...", content_delta)
         yield {"type": "content_delta", "content_delta": content_delta}
 
   latency_ms = (time.perf_counter() - started) * 1000.0
@@ -997,6 +1119,7 @@ async def _invoke_event_parser_stream(kind: str,
     return
 
   # 2nd Pass: With Context
+  await _await_context_prefetch(prefetch)
   context = _build_events_context(scopes, session_id=context_session_id, is_google=is_google)
   _set_context_cache(context_cache_key, context)
   payload_with_context = _build_events_user_payload(text, bool(images), context)
@@ -1015,7 +1138,7 @@ async def _invoke_event_parser_stream(kind: str,
         kind,
         sys_prompt,
         payload_with_context,
-        images,
+        image_parts,
         reasoning_effort=reasoning_effort,
         model_name=model_name)
     model = _sanitize_model(model_name) or DEFAULT_MULTIMODAL_MODEL
@@ -1038,7 +1161,7 @@ async def _invoke_event_parser_stream(kind: str,
       if extracted is not None and len(extracted) > len(prev_extracted_content):
         content_delta = extracted[len(prev_extracted_content):]
         prev_extracted_content = extracted
-        _log_debug(f"[STREAM DEBUG 2ND] content_delta: {content_delta[:50]}...")
+        _log_debug("[STREAM DEBUG 2ND] content_delta: %.50s...", content_delta)
         yield {"type": "content_delta", "content_delta": content_delta}
   
   latency_ms = (time.perf_counter() - started) * 1000.0
@@ -1096,6 +1219,9 @@ def _debug_print(
     _log_debug(
         f"[LLM DEBUG] usage: prompt={p}, completion={c}, total={t}, cached_prompt={cached_prompt}"
     )
+    if p:
+      _log_debug(
+          f"[LLM DEBUG] prompt cache hit: {(cached_prompt or 0) / p * 100:.1f}%")
     cost = _estimate_llm_cost(model_name, p, cached_prompt, c)
     if cost:
       usd, krw = cost
@@ -1103,32 +1229,45 @@ def _debug_print(
           f"[LLM DEBUG] cost: ${usd:.6f} ≈ ₩{krw:,.0f} (model={model_name})")
 
 
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _safe_json_loads(raw: str) -> Dict[str, Any]:
   if not raw or not isinstance(raw, str):
     return {}
-  raw = raw.strip()
-
-  try:
-    obj = json.loads(raw)
-    return obj if isinstance(obj, dict) else {}
-  except Exception:
-    pass
 
-  start = raw.find("{")
-  end = raw.rfind("}")
-  if start != -1 and end != -1 and end > start:
+  if orjson is not None:
     try:
-      obj = json.loads(raw[start:end + 1])
+      obj = orjson.loads(raw)
       return obj if isinstance(obj, dict) else {}
-    except Exception:
-      return {}
+    except orjson.JSONDecodeError:
+      pass
+
+  # 앞뒤 설명 문장이 섞여도 첫 '{'부터 한 번만 파싱한다.
+  start = raw.find("{")
+  if start == -1:
+    return {}
+  try:
+    obj, _ = _JSON_DECODER.raw_decode(raw, start)
+  except ValueError:
+    return {}
+  return obj if isinstance(obj, dict) else {}
 
-  return {}
+
+_ref_line_cache: Tuple[date, str] = (date.min, "")
 
 
 def _current_reference_line() -> str:
-  now = datetime.now(SEOUL)
-  return f"기준 시각: {now.strftime('%Y-%m-%d')} (Asia/Seoul)\n"
+  global _ref_line_cache
+  today = datetime.now(SEOUL).date()
+  if today != _ref_line_cache[0]:
+    _ref_line_cache = (today, f"기준 시각: {today.isoformat()} (Asia/Seoul)\n")
+  return _ref_line_cache[1]
+
+
+def _with_reference_line(user_text: str) -> str:
+  # 기준 시각은 매번 달라지므로 뒤에 붙여서 프롬프트 캐시 prefix를 유지한다.
+  return f"{user_text}\n{_current_reference_line()}"
 
 
 def _resolve_request_id(raw: Optional[str]) -> str:
@@ -1200,7 +1339,7 @@ async def _chat_json(kind: str,
     """
   c = get_async_client()
 
-  input_text = _current_reference_line() + user_text
+  input_text = _with_reference_line(user_text)
 
   started = time.perf_counter()
   effort_value = _pick_reasoning_effort(reasoning_effort,
@@ -1220,8 +1359,7 @@ async def _chat_json(kind: str,
             },
         ],
         max_completion_tokens=10000,
-        reasoning_effort=effort_value,
-        verbosity="low",
+        **_model_request_kwargs(model, effort_value, "low"),
         response_format={"type": "json_object"},
     )
 
@@ -1234,7 +1372,8 @@ async def _chat_json(kind: str,
     usage_dict: Optional[Dict[str, Any]] = None
     usage_obj = getattr(completion, "usage", None)
     if usage_obj is not None:
-      prompt_details = getattr(usage_obj, "prompt_tokens_details", None)
+      prompt_details = _details_to_dict(
+          getattr(usage_obj, "prompt_tokens_details", None))
       cached_prompt = (_get_detail_value(prompt_details, "cached_tokens")
                        or _get_detail_value(prompt_details,
                                             "cached_prompt_tokens"))
@@ -1250,7 +1389,7 @@ async def _chat_json(kind: str,
     return _safe_json_loads(raw_content)
 
   except Exception as e:
-    _log_debug(f"[LLM DEBUG] exception: {repr(e)}")
+    _log_debug("[LLM DEBUG] exception: %r", e)
     raise
 
 
@@ -1260,7 +1399,7 @@ async def _chat_json_stream(kind: str,
                             reasoning_effort: Optional[str] = None,
                             model_name: Optional[str] = None):
   c = get_async_client()
-  input_text = _current_reference_line() + user_text
+  input_text = _with_reference_line(user_text)
   effort_value = _pick_reasoning_effort(reasoning_effort,
                                         DEFAULT_TEXT_REASONING_EFFORT)
   model = _sanitize_model(model_name) or DEFAULT_TEXT_MODEL
@@ -1278,19 +1417,23 @@ async def _chat_json_stream(kind: str,
             },
         ],
         max_completion_tokens=10000,
-        reasoning_effort=effort_value,
+        **_model_request_kwargs(model, effort_value),
         stream=True,
         response_format={"type": "json_object"},
     )
   except Exception as e:
-    _log_debug(f"[LLM DEBUG] stream exception: {repr(e)}")
+    _log_debug("[LLM DEBUG] stream exception: %r", e)
     raise
 
 
+def _build_image_parts(images: List[str]) -> List[Dict[str, Any]]:
+  return [{"type": "image_url", "image_url": {"url": img}} for img in images]
+
+
 async def _chat_multimodal_json(kind: str,
                                 system_prompt: str,
                                 user_text: str,
-                                images: List[str],
+                                image_parts: List[Dict[str, Any]],
                                 reasoning_effort: Optional[str] = None,
                                 model_name: Optional[str] = None) -> Dict[str,
                                                                          Any]:
@@ -1298,16 +1441,8 @@ async def _chat_multimodal_json(kind: str,
 
   user_parts: List[Dict[str, Any]] = [{
       "type": "text",
-      "text": _current_reference_line() + user_text
-  }]
-
-  for img in images:
-    user_parts.append({
-        "type": "image_url",
-        "image_url": {
-            "url": img
-        }
-    })
+      "text": _with_reference_line(user_text)
+  }, *image_parts]
 
   started = time.perf_counter()
   effort_value = _pick_reasoning_effort(reasoning_effort,
@@ -1330,8 +1465,7 @@ async def _chat_multimodal_json(kind: str,
             },
         ],
         max_completion_tokens=10000,
-        reasoning_effort=effort_value,
-        verbosity="low",
+        **_model_request_kwargs(model, effort_value, "low"),
         response_format={"type": "json_object"},
     )
 
@@ -1344,7 +1478,8 @@ async def _chat_multimodal_json(kind: str,
     usage_dict: Optional[Dict[str, Any]] = None
     usage_obj = getattr(completion, "usage", None)
     if usage_obj is not None:
-      prompt_details = getattr(usage_obj, "prompt_tokens_details", None)
+      prompt_details = _details_to_dict(
+          getattr(usage_obj, "prompt_tokens_details", None))
       cached_prompt = (_get_detail_value(prompt_details, "cached_tokens")
                        or _get_detail_value(prompt_details,
                                             "cached_prompt_tokens"))
@@ -1360,28 +1495,21 @@ async def _chat_multimodal_json(kind: str,
     return _safe_json_loads(raw_content)
 
   except Exception as e:
-    _log_debug(f"[LLM DEBUG] exception: {repr(e)}")
+    _log_debug("[LLM DEBUG] exception: %r", e)
     raise
 
 
 async def _chat_multimodal_json_stream(kind: str,
                                        system_prompt: str,
                                        user_text: str,
-                                       images: List[str],
+                                       image_parts: List[Dict[str, Any]],
                                        reasoning_effort: Optional[str] = None,
                                        model_name: Optional[str] = None):
   c = get_async_client()
   user_parts: List[Dict[str, Any]] = [{
       "type": "text",
-      "text": _current_reference_line() + user_text
-  }]
-  for img in images:
-    user_parts.append({
-        "type": "image_url",
-        "image_url": {
-            "url": img
-        }
-    })
+      "text": _with_reference_line(user_text)
+  }, *image_parts]
   effort_value = _pick_reasoning_effort(reasoning_effort,
                                         DEFAULT_MULTIMODAL_REASONING_EFFORT)
   model = _sanitize_model(model_name) or DEFAULT_MULTIMODAL_MODEL
@@ -1402,10 +1530,10 @@ async def _chat_multimodal_json_stream(kind: str,
             },
         ],
         max_completion_tokens=10000,
-        reasoning_effort=effort_value,
+        **_model_request_kwargs(model, effort_value),
         stream=True,
         response_format={"type": "json_object"},
     )
   except Exception as e:
-    _log_debug(f"[LLM DEBUG] multimodal stream exception: {repr(e)}")
+    _log_debug("[LLM DEBUG] multimodal stream exception: %r", e)
     raise
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
 from typing import List, Optional, Dict, Any, Union
 
 
@@ -62,6 +62,21 @@ class EventUpdate(BaseModel):
     color_id: Optional[str] = None
     all_day: Optional[bool] = None
 
+    # PATCH 핸들러가 하던 정리를 검증 단계에서 끝낸다(빈 문자열/음수 분 제거).
+    @field_validator("attendees")
+    @classmethod
+    def _strip_attendees(cls, value: Optional[List[str]]) -> Optional[List[str]]:
+        if value is None:
+            return None
+        return [email for item in value if (email := item.strip())]
+
+    @field_validator("reminders")
+    @classmethod
+    def _drop_negative_reminders(cls, value: Optional[List[int]]) -> Optional[List[int]]:
+        if value is None:
+            return None
+        return [minutes for minutes in value if minutes >= 0]
+
 
 class RecurrenceEndPayload(BaseModel):
     until: Optional[str] = None
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
-from datetime import date, datetime, timedelta
-from typing import Any, Dict, List, Optional, Tuple
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 import calendar
 import re
 
 from zoneinfo import ZoneInfo
 
 from .config import (
-    ISO_DATE_RE,
+    SEOUL,
+    HHMM_RE,
     MAX_RECURRENCE_EXPANSION_DAYS,
     MAX_RECURRENCE_OCCURRENCES,
 )
-from .utils import _normalize_exception_date
+from .utils import _format_iso_minute, _is_iso_date, _normalize_exception_date
 
 _RRULE_FREQS = {"DAILY", "WEEKLY", "MONTHLY", "YEARLY"}
 _RRULE_WEEKDAY_TO_INDEX = {
@@ -25,6 +28,19 @@ _RRULE_WEEKDAY_TO_INDEX = {
     "SU": 6,
 }
 _RRULE_INDEX_TO_WEEKDAY = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+_RRULE_UNTIL_RE = re.compile(r"\d{8}(T\d{6}Z?)?", re.ASCII)
+_RRULE_BYDAY_TOKEN_RE = re.compile(r"([+-]?\d)?(MO|TU|WE|TH|FR|SA|SU)", re.ASCII)
+
+
+@lru_cache(maxsize=64)
+def _tz(name: str) -> ZoneInfo:
+    return ZoneInfo(name)
+
+
+def _resolve_tz(name: str) -> ZoneInfo:
+    if name == "Asia/Seoul":
+        return SEOUL
+    return _tz(name)
 
 
 def _normalize_int_list(value: Any,
@@ -92,7 +108,7 @@ def _normalize_recurrence_dict(recurrence: Dict[str, Any]) -> Optional[Dict[str,
         until_raw = end_raw.get("until")
         count_raw = end_raw.get("count")
         until = (until_raw.strip() if isinstance(until_raw, str) else None)
-        if until and not ISO_DATE_RE.match(until):
+        if until and not _is_iso_date(until):
             until = None
         count: Optional[int] = None
         if count_raw is not None:
@@ -109,7 +125,7 @@ def _normalize_recurrence_dict(recurrence: Dict[str, Any]) -> Optional[Dict[str,
     elif isinstance(end_raw, str):
         # LLM shorthand: "end": "2026-04-10" → treat as until date
         stripped = end_raw.strip()
-        if stripped and ISO_DATE_RE.match(stripped):
+        if stripped and _is_iso_date(stripped):
             end = {"until": stripped, "count": None}
     elif isinstance(end_raw, (int, float)) and int(end_raw) > 0:
         # LLM shorthand: "end": 10 → treat as count
@@ -190,7 +206,7 @@ def _normalize_rrule_core(rrule: Any) -> Optional[str]:
     until_raw = values.get("UNTIL")
     if until_raw is not None:
         until_clean = until_raw.strip().upper()
-        if not re.match(r"^\d{8}(T\d{6}Z?)?$", until_clean):
+        if not _RRULE_UNTIL_RE.fullmatch(until_clean):
             return None
         values["UNTIL"] = until_clean
 
@@ -201,7 +217,7 @@ def _normalize_rrule_core(rrule: Any) -> Optional[str]:
     if byday_raw is not None:
         normalized_days: List[str] = []
         for token in [tok.strip().upper() for tok in byday_raw.split(",") if tok.strip()]:
-            match = re.match(r"^([+-]?\d)?(MO|TU|WE|TH|FR|SA|SU)$", token)
+            match = _RRULE_BYDAY_TOKEN_RE.fullmatch(token)
             if not match:
                 return None
             pos_raw = match.group(1)
@@ -300,7 +316,7 @@ def _rrule_to_recurrence(rrule_core: str) -> Optional[Dict[str, Any]]:
         seen_weekdays: set[int] = set()
         setpos_values: set[int] = set()
         for token in byday_raw.split(","):
-            match = re.match(r"^([+-]?\d)?(MO|TU|WE|TH|FR|SA|SU)$", token)
+            match = _RRULE_BYDAY_TOKEN_RE.fullmatch(token)
             if not match:
                 continue
             pos_raw = match.group(1)
@@ -379,7 +395,7 @@ def _build_legacy_weekly_recurrence(item: Dict[str, Any]) -> Optional[Dict[str,
         return None
     end_date_str = item.get("end_date")
     until = None
-    if isinstance(end_date_str, str) and ISO_DATE_RE.match(end_date_str.strip()):
+    if isinstance(end_date_str, str) and _is_iso_date(end_date_str.strip()):
         until = end_date_str.strip()
     end = {"until": until, "count": None} if until else None
     return {
@@ -506,7 +522,7 @@ def _collect_recurrence_dates(recurrence: Dict[str, Any],
     until_date: Optional[date] = None
     count: Optional[int] = None
     until_raw = end.get("until")
-    if isinstance(until_raw, str) and ISO_DATE_RE.match(until_raw):
+    if isinstance(until_raw, str) and _is_iso_date(until_raw):
         try:
             until_date = datetime.strptime(until_raw, "%Y-%m-%d").date()
         except Exception:
@@ -564,10 +580,11 @@ def _collect_recurrence_dates(recurrence: Dict[str, Any],
             offset = delta_days % interval
             cur = scope_start if offset == 0 else scope_start + timedelta(
                 days=interval - offset)
+        step = timedelta(days=interval)
         while cur <= limit_date:
             if push_date(cur):
                 break
-            cur += timedelta(days=interval)
+            cur += step
 
     elif freq == "WEEKLY":
         weekdays = sorted({int(w) for w in byweekday
@@ -576,34 +593,40 @@ def _collect_recurrence_dates(recurrence: Dict[str, Any],
             weekdays = [start_date.weekday()]
 
         base = start_date - timedelta(days=start_date.weekday())
-        week_index = 0
+        weekday_offsets = [timedelta(days=w) for w in weekdays]
+        week_step = timedelta(days=interval * 7)
+        # scope 시작 이전 주기는 모든 발생일이 scope_start보다 앞이므로 건너뛴다.
+        week_index = max(0, (scope_start - base).days // (interval * 7))
+        week_start = base + week_step * week_index
         while True:
-            week_start = base + timedelta(days=week_index * interval * 7)
             if week_start > limit_date:
                 break
-            for w in weekdays:
-                occ = week_start + timedelta(days=w)
+            for offset in weekday_offsets:
+                occ = week_start + offset
                 if occ < scope_start:
                     continue
                 if occ > limit_date:
                     continue
                 if push_date(occ):
                     return results
-            week_index += 1
+            week_start += week_step
 
     elif freq == "MONTHLY":
-        month_index = 0
+        monthly_rule = {
+            "bymonthday": bymonthday,
+            "byweekday": byweekday,
+            "bysetpos": bysetpos
+        }
+        months_to_scope = ((scope_start.year - start_date.year) * 12
+                           + scope_start.month - start_date.month)
+        month_index = max(0, months_to_scope // interval)
         while True:
             year, month = _add_months(start_date.year, start_date.month,
                                       month_index * interval)
             first_day = date(year, month, 1)
             if first_day > limit_date:
                 break
-            candidates = _monthly_candidates(year, month, {
-                "bymonthday": bymonthday,
-                "byweekday": byweekday,
-                "bysetpos": bysetpos
-            }, start_date.day)
+            candidates = _monthly_candidates(year, month, monthly_rule, start_date.day)
             for occ in candidates:
                 if occ < scope_start:
                     continue
@@ -618,18 +641,19 @@ def _collect_recurrence_dates(recurrence: Dict[str, Any],
         if not months:
             months = [start_date.month]
 
-        year_index = 0
+        monthly_rule = {
+            "bymonthday": bymonthday,
+            "byweekday": byweekday,
+            "bysetpos": bysetpos
+        }
+        year_index = max(0, (scope_start.year - start_date.year) // interval)
         while True:
             year = start_date.year + year_index * interval
             first_day = date(year, 1, 1)
             if first_day > limit_date:
                 break
             for month in months:
-                candidates = _monthly_candidates(year, month, {
-                    "bymonthday": bymonthday,
-                    "byweekday": byweekday,
-                    "bysetpos": bysetpos
-                }, start_date.day)
+                candidates = _monthly_candidates(year, month, monthly_rule, start_date.day)
                 for occ in candidates:
                     if occ < scope_start:
                         continue
@@ -645,35 +669,76 @@ def _collect_recurrence_dates(recurrence: Dict[str, Any],
     return results
 
 
+def _freeze_recurrence(value: Any) -> Any:
+    """recurrence dict를 lru_cache 키로 쓸 수 있게 dict→frozenset, list→tuple로 바꾼다."""
+    if isinstance(value, dict):
+        return frozenset((k, _freeze_recurrence(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return tuple(_freeze_recurrence(v) for v in value)
+    return value
+
+
+def _thaw_recurrence(value: Any) -> Any:
+    if isinstance(value, frozenset):
+        return {k: _thaw_recurrence(v) for k, v in value}
+    return value
+
+
+@lru_cache(maxsize=512)
+def _collect_recurrence_dates_cached(frozen_recurrence: frozenset,
+                                     start_date: date,
+                                     scope: Optional[Tuple[date, date]]) -> Tuple[date, ...]:
+    return tuple(_collect_recurrence_dates(_thaw_recurrence(frozen_recurrence),
+                                           start_date, scope=scope))
+
+
+def _recurrence_dates(recurrence: Dict[str, Any],
+                      start_date: date,
+                      scope: Optional[Tuple[date, date]] = None) -> Tuple[date, ...]:
+    """같은 규칙/시작일/범위의 전개 결과는 캐시에서 재사용한다."""
+    try:
+        return _collect_recurrence_dates_cached(_freeze_recurrence(recurrence),
+                                                start_date, scope)
+    except TypeError:
+        # 해시할 수 없는 값이 섞여 있으면 캐시 없이 전개한다.
+        return tuple(_collect_recurrence_dates(recurrence, start_date, scope=scope))
+
+
 def _expand_recurring_item(item: Dict[str, Any],
-                           scope: Optional[Tuple[date, date]] = None) -> List[Dict[str, Any]]:
+                           scope: Optional[Tuple[date, date]] = None,
+                           limit: Optional[int] = None) -> List[Dict[str, Any]]:
     """
-    recurring item -> 여러 개의 단일 일정 dict로 전개
+    recurring item -> 여러 개의 단일 일정 dict로 전개 (limit이 있으면 앞에서부터 limit개만)
     """
+    return list(islice(_iter_recurring_item(item, scope), limit))
+
+
+def _iter_recurring_item(item: Dict[str, Any],
+                         scope: Optional[Tuple[date, date]] = None) -> Iterator[Dict[str, Any]]:
+    """_expand_recurring_item의 지연 버전. 필요한 만큼만 발생 일정 dict를 만든다."""
     title = (item.get("title") or "").strip()
     start_date_str = item.get("start_date")
     if not title or not isinstance(start_date_str, str):
-        return []
+        return
 
     recurrence = _resolve_recurrence(item)
     if not recurrence:
-        return []
+        return
 
     try:
         start_date = datetime.strptime(start_date_str, "%Y-%m-%d").date()
     except Exception:
-        return []
+        return
 
     time_str = item.get("time")
     duration_minutes = item.get("duration_minutes")
     location = item.get("location")
     timezone_str = item.get("timezone") or "Asia/Seoul"
-    tzinfo = ZoneInfo(timezone_str)
+    tzinfo = _resolve_tz(timezone_str)
 
     hh, mm = 0, 0
     time_valid = False
-    if isinstance(time_str, str) and re.match(r"^\d{2}:\d{2}$",
-                                              time_str.strip()):
+    if isinstance(time_str, str) and HHMM_RE.fullmatch(time_str.strip()):
         hh, mm = [int(x) for x in time_str.strip().split(":")]
         time_valid = 0 <= hh <= 23 and 0 <= mm <= 59
 
@@ -695,45 +760,37 @@ def _expand_recurring_item(item: Dict[str, Any],
             if normalized:
                 exceptions.add(normalized)
 
-    results: List[Dict[str, Any]] = []
+    start_time = time(hh, mm, tzinfo=tzinfo) if time_valid else None
+    all_day_start = time(0, 0, tzinfo=tzinfo)
+    all_day_end = time(23, 59, tzinfo=tzinfo)
 
-    for cur in _collect_recurrence_dates(recurrence, start_date, scope=scope):
-        if cur.strftime("%Y-%m-%d") in exceptions:
+    for cur in _recurrence_dates(recurrence, start_date, scope=scope):
+        # COUNT 규칙은 시작일부터 세어야 해서 _collect_recurrence_dates가 scope로 자르지 않고 돌려준다.
+        if scope and not (scope[0] <= cur <= scope[1]):
+            continue
+        if cur.isoformat() in exceptions:
             continue
         if time_valid:
-            start_dt = datetime(cur.year, cur.month, cur.day, hh, mm, tzinfo=tzinfo)
-            start_str = start_dt.strftime("%Y-%m-%dT%H:%M")
+            start_dt = datetime.combine(cur, start_time)
+            start_str = _format_iso_minute(start_dt)
             end_str: Optional[str] = None
             if dur is not None:
                 end_dt = start_dt + timedelta(minutes=dur)
-                end_str = end_dt.strftime("%Y-%m-%dT%H:%M")
+                end_str = _format_iso_minute(end_dt)
         else:
-            start_dt = datetime(cur.year, cur.month, cur.day, 0, 0, tzinfo=tzinfo)
-            end_dt = datetime(cur.year, cur.month, cur.day, 23, 59, tzinfo=tzinfo)
-            start_str = start_dt.strftime("%Y-%m-%dT%H:%M")
-            end_str = end_dt.strftime("%Y-%m-%dT%H:%M")
+            start_dt = datetime.combine(cur, all_day_start)
+            end_dt = datetime.combine(cur, all_day_end)
+            start_str = _format_iso_minute(start_dt)
+            end_str = _format_iso_minute(end_dt)
 
-        results.append({
+        yield {
             "title": title,
             "start": start_str,
             "end": end_str,
             "location": location_str,
             "recur": "recurring",
             "all_day": not time_valid
-        })
-
-    if scope:
-        filtered: List[Dict[str, Any]] = []
-        for ev in results:
-            start_iso = ev.get("start")
-            if not isinstance(start_iso, str):
-                continue
-            start_date_value = datetime.strptime(start_iso[:10], "%Y-%m-%d").date()
-            if scope[0] <= start_date_value <= scope[1]:
-                filtered.append(ev)
-        return filtered
-
-    return results
+        }
 
 
 def _format_rrule_until(until_date: date,
@@ -742,15 +799,19 @@ def _format_rrule_until(until_date: date,
     """Format UNTIL value for RRULE.
     Google Calendar requires UNTIL in UTC with Z suffix for timed events,
     or YYYYMMDD for all-day events."""
-    tzinfo = ZoneInfo(tz_name)
-    if isinstance(time_str, str) and re.match(r"^\d{2}:\d{2}$", time_str):
-        hh, mm = [int(x) for x in time_str.split(":")]
-        local_dt = datetime(until_date.year, until_date.month, until_date.day,
-                            hh, mm, 0, tzinfo=tzinfo)
-        utc_dt = local_dt.astimezone(ZoneInfo("UTC"))
-        return utc_dt.strftime("%Y%m%dT%H%M%SZ")
+    if isinstance(time_str, str) and HHMM_RE.fullmatch(time_str):
+        hh, mm = int(time_str[:2]), int(time_str[3:])
+        if tz_name == "UTC":
+            utc_dt = datetime(until_date.year, until_date.month, until_date.day,
+                              hh, mm, 0, tzinfo=timezone.utc)
+        else:
+            local_dt = datetime(until_date.year, until_date.month, until_date.day,
+                                hh, mm, 0, tzinfo=_resolve_tz(tz_name))
+            utc_dt = local_dt.astimezone(timezone.utc)
+        return (f"{utc_dt.year:04d}{utc_dt.month:02d}{utc_dt.day:02d}"
+                f"T{utc_dt.hour:02d}{utc_dt.minute:02d}{utc_dt.second:02d}Z")
     # All-day: use date-only format
-    return until_date.strftime("%Y%m%d")
+    return f"{until_date.year:04d}{until_date.month:02d}{until_date.day:02d}"
 
 
 def _build_rrule_core(recurrence: Dict[str, Any],
@@ -768,17 +829,17 @@ def _build_rrule_core(recurrence: Dict[str, Any],
 
     byweekday = recurrence.get("byweekday") or []
     if byweekday:
-        weekdays = [_RRULE_INDEX_TO_WEEKDAY[int(w)] for w in byweekday if 0 <= int(w) <= 6]
+        weekdays = [_RRULE_INDEX_TO_WEEKDAY[w] for w in map(int, byweekday) if 0 <= w <= 6]
         if weekdays:
             parts.append("BYDAY=" + ",".join(weekdays))
 
     bymonthday = recurrence.get("bymonthday") or []
     if bymonthday:
-        parts.append("BYMONTHDAY=" + ",".join(str(int(d)) for d in bymonthday))
+        parts.append("BYMONTHDAY=" + ",".join(map(str, map(int, bymonthday))))
 
     bymonth = recurrence.get("bymonth") or []
     if bymonth:
-        parts.append("BYMONTH=" + ",".join(str(int(m)) for m in bymonth))
+        parts.append("BYMONTH=" + ",".join(map(str, map(int, bymonth))))
 
     bysetpos = recurrence.get("bysetpos")
     if bysetpos:
@@ -791,7 +852,7 @@ def _build_rrule_core(recurrence: Dict[str, Any],
     until_raw = end.get("until")
     count_raw = end.get("count")
     until_date: Optional[date] = None
-    if isinstance(until_raw, str) and ISO_DATE_RE.match(until_raw):
+    if isinstance(until_raw, str) and _is_iso_date(until_raw):
         try:
             until_date = datetime.strptime(until_raw, "%Y-%m-%d").date()
         except Exception:
@@ -2,15 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import copy
+import hashlib
 import json
 import logging
 import urllib
 import uuid
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 from threading import Lock
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
 from fastapi import APIRouter, HTTPException, Query, Request, Response
 from fastapi.responses import RedirectResponse, JSONResponse, HTMLResponse, StreamingResponse
 
@@ -41,9 +42,9 @@ from .models import (
     AgentRunRequest,
 )
 from .frontend import (
-    CALENDAR_HTML_TEMPLATE,
     SETTINGS_HTML,
     LOGIN_HTML,
+    render_calendar_html,
 )
 from .utils import (
     _log_debug,
@@ -68,6 +69,7 @@ from .gcal import (
     clear_gcal_token_for_session,
     get_google_session_id,
     require_google_session_id,
+    google_http_session,
     get_google_tasks_service,
     get_google_userinfo,
     list_google_calendars,
@@ -369,7 +371,7 @@ def google_callback(request: Request):
       "grant_type": "authorization_code",
   }
 
-  resp = requests.post(token_endpoint, data=data)
+  resp = google_http_session.post(token_endpoint, data=data)
   if not resp.ok:
     _log_debug(f"[GCAL] token exchange failed: {resp.status_code} {resp.text}")
     raise HTTPException(status_code=500,
@@ -869,6 +871,15 @@ def google_update_event_api(request: Request,
   session_id = get_google_session_id(request)
   if not session_id:
     raise HTTPException(status_code=401, detail="Google login is required.")
+  if not payload.model_dump(exclude_none=True):
+    # 바뀐 필드가 없으면 기존 일정 조회와 patch, 재동기화까지 Google 왕복을 모두 건너뛴다.
+    # 응답 모양은 일반 PATCH와 같게 두고, revision은 올리지 않은 현재 값을 그대로 돌려준다.
+    return {
+        "ok": True,
+        "event": None,
+        "new_revision": get_google_revision_state(session_id).get("revision", 0),
+        "op_id": None,
+    }
 
   start_iso = _coerce_patch_start(payload.start)
   if payload.start is None:
@@ -902,30 +913,9 @@ def google_update_event_api(request: Request,
     cleaned = _clean_optional_str(payload.description)
     description_value = "" if cleaned is None else cleaned
 
-  attendees_value: Optional[List[str]] = None
-  if payload.attendees is not None:
-    cleaned_attendees: List[str] = []
-    if isinstance(payload.attendees, list):
-      for item in payload.attendees:
-        if not isinstance(item, str):
-          continue
-        email = item.strip()
-        if email:
-          cleaned_attendees.append(email)
-    attendees_value = cleaned_attendees
-
-  reminders_value: Optional[List[int]] = None
-  if payload.reminders is not None:
-    cleaned_reminders: List[int] = []
-    if isinstance(payload.reminders, list):
-      for item in payload.reminders:
-        try:
-          minutes = int(item)
-        except Exception:
-          continue
-        if minutes >= 0:
-          cleaned_reminders.append(minutes)
-    reminders_value = cleaned_reminders
+  # attendees/reminders는 EventUpdate 검증 단계에서 이미 정리되어 들어온다.
+  attendees_value: Optional[List[str]] = payload.attendees
+  reminders_value: Optional[List[int]] = payload.reminders
 
   visibility_value: Optional[str] = payload.visibility if payload.visibility is not None else None
   transparency_value: Optional[str] = payload.transparency if payload.transparency is not None else None
@@ -941,29 +931,31 @@ def google_update_event_api(request: Request,
     color_value = payload.color_id
 
   all_day_flag = payload.all_day
-  if all_day_flag is None:
+  if all_day_flag is None and start_iso is not None:
     all_day_flag = is_all_day_span(start_iso, end_iso)
+  # 시간을 바꾸지 않는 요청은 all_day=None 으로 보내 기존 일정 조회(get) 없이 시간 필드를 건드리지 않는다.
 
   try:
-    gcal_update_event(event_id,
-                      title_value,
-                      start_iso,
-                      end_iso,
-                      location_value,
-                      bool(all_day_flag),
-                      session_id=session_id,
-                      description=description_value,
-                      attendees=attendees_value,
-                      reminders=reminders_value,
-                      visibility=visibility_value,
-                      transparency=transparency_value,
-                      meeting_url=meeting_url_value,
-                      timezone_value=timezone_value,
-                      color_id=color_value,
-                      calendar_id=calendar_id)
+    patched = gcal_update_event(event_id,
+                                title_value,
+                                start_iso,
+                                end_iso,
+                                location_value,
+                                all_day_flag,
+                                session_id=session_id,
+                                description=description_value,
+                                attendees=attendees_value,
+                                reminders=reminders_value,
+                                visibility=visibility_value,
+                                transparency=transparency_value,
+                                meeting_url=meeting_url_value,
+                                timezone_value=timezone_value,
+                                color_id=color_value,
+                                calendar_id=calendar_id)
     mutation_meta = sync_google_event_after_write(session_id,
                                                   event_id=event_id,
-                                                  calendar_id=calendar_id)
+                                                  calendar_id=calendar_id,
+                                                  latest=patched)
   except Exception as exc:
     raise HTTPException(status_code=502,
                         detail=f"Google event update failed: {exc}") from exc
@@ -1262,7 +1254,9 @@ async def agent_run_stream(body: AgentRunRequest, request: Request, response: Re
 
 @router.get("/api/agent/debug")
 async def agent_debug_status(request: Request):
-  session_id = get_google_session_id(request) or _get_session_id(request)
+  # get_google_session_id 는 쿠키 세션 ID를 그대로 돌려주거나 None 이라 결과가 항상 쿠키 값과 같다.
+  # 토큰 파일을 읽어 파싱할 필요 없이 쿠키만 한 번 해석한다.
+  session_id = _get_session_id(request)
   return _agent_debug_get(session_id)
 
 
@@ -1295,71 +1289,73 @@ def build_header_actions(has_token: bool) -> str:
   return "\n".join(parts)
 
 
+# 페이지 라우트가 매 요청 만들던 리다이렉트 URL과 정적 HTML 인코딩을 로드 시 한 번만 한다.
+# Response 객체는 미들웨어가 헤더 리스트를 고칠 수 있어 공유하지 않고 요청마다 만든다.
+_CALENDAR_PAGE_URL = _frontend_url("/calendar")
+_LOGIN_PAGE_URL = _frontend_url("/login")
+_SETTINGS_HTML_BYTES = SETTINGS_HTML.encode("utf-8")
+_LOGIN_HTML_BYTES = LOGIN_HTML.encode("utf-8")
+
+
+def _html_etag(body: bytes) -> str:
+  return f'"{hashlib.sha1(body).hexdigest()}"'
+
+
+_SETTINGS_HTML_ETAG = _html_etag(_SETTINGS_HTML_BYTES)
+_LOGIN_HTML_ETAG = _html_etag(_LOGIN_HTML_BYTES)
+
+
+def _conditional_html_response(request: Request, body: bytes, etag: str) -> Response:
+  """본문이 바뀌지 않았으면 304로 전송을 생략한다. 매번 재검증하도록 no-cache를 붙인다."""
+  headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+  if_none_match = request.headers.get("if-none-match")
+  if if_none_match and etag in (tag.strip() for tag in if_none_match.split(",")):
+    return Response(status_code=304, headers=headers)
+  return HTMLResponse(body, headers=headers)
+
+
 @router.get("/", response_class=HTMLResponse)
 def start_page(request: Request):
   if load_gcal_token_for_request(request) is not None:
-    return RedirectResponse(_frontend_url("/calendar"))
-  return RedirectResponse(_frontend_url("/login"))
+    return RedirectResponse(_CALENDAR_PAGE_URL)
+  return RedirectResponse(_LOGIN_PAGE_URL)
 
 
 @router.get("/calendar", response_class=HTMLResponse)
 def calendar_page(request: Request):
   if load_gcal_token_for_request(request) is None:
-    return RedirectResponse(_frontend_url("/login"))
+    return RedirectResponse(_LOGIN_PAGE_URL)
+  body, etag = _render_calendar_page(True)
+  return _conditional_html_response(request, body, etag)
+
 
-  token_present = load_gcal_token_for_request(request) is not None
+@lru_cache(maxsize=4)
+def _render_calendar_page(token_present: bool) -> Tuple[bytes, str]:
+  """입력은 토큰 유무뿐이고 API_BASE와 템플릿은 프로세스 내내 고정이라, 인코딩된 결과를 재사용한다."""
   actions_html = build_header_actions(token_present)
   context = {
       "google_linked": token_present,
       "mode": "google",
   }
-  html = CALENDAR_HTML_TEMPLATE.replace("__HEADER_ACTIONS__", actions_html)
   context_json = json.dumps(context, ensure_ascii=False)
   api_base_json = json.dumps(API_BASE, ensure_ascii=False)
   context_script = (
       f"<script>window.__APP_CONTEXT__ = {context_json};"
       f"window.__API_BASE__ = {api_base_json};</script>")
-  if "</head>" in html:
-    html = html.replace("</head>", f"{context_script}\n</head>", 1)
-  else:
-    html = context_script + html
-  def _has_script_src(text: str, src: str) -> bool:
-    return f'src="{src}"' in text or f"src='{src}'" in text
-
-  if "https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/index.global.min.css" not in html:
-    css_tag = ('<link rel="stylesheet" '
-               'href="https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/index.global.min.css">')
-    if "</head>" in html:
-      html = html.replace("</head>", f"{css_tag}\n</head>", 1)
-    else:
-      html = css_tag + html
-
-  if not _has_script_src(html, "https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/index.global.min.js"):
-    fullcalendar_tag = (
-        '<script src="https://cdn.jsdelivr.net/npm/fullcalendar@6.1.15/'
-        'index.global.min.js" defer></script>')
-    if "</head>" in html:
-      html = html.replace("</head>", f"{fullcalendar_tag}\n</head>", 1)
-    else:
-      html = fullcalendar_tag + html
-  if not _has_script_src(html, "/calendar-app.js"):
-    app_tag = '<script src="/calendar-app.js" defer></script>'
-    if "</body>" in html:
-      html = html.replace("</body>", f"{app_tag}\n</body>", 1)
-    else:
-      html = html + app_tag
-  return HTMLResponse(html)
+  # 정적 태그 삽입은 frontend 모듈이 로드 시 한 번만 해 둔다.
+  body = render_calendar_html(actions_html, context_script).encode("utf-8")
+  return body, _html_etag(body)
 
 
 @router.get("/settings", response_class=HTMLResponse)
 def settings_page(request: Request):
   if load_gcal_token_for_request(request) is None:
-    return RedirectResponse(_frontend_url("/login"))
-  return HTMLResponse(SETTINGS_HTML)
+    return RedirectResponse(_LOGIN_PAGE_URL)
+  return _conditional_html_response(request, _SETTINGS_HTML_BYTES, _SETTINGS_HTML_ETAG)
 
 
 @router.get("/login", response_class=HTMLResponse)
 def login_page(request: Request):
   if load_gcal_token_for_request(request) is not None:
-    return RedirectResponse(_frontend_url("/calendar"))
-  return HTMLResponse(LOGIN_HTML)
+    return RedirectResponse(_CALENDAR_PAGE_URL)
+  return _conditional_html_response(request, _LOGIN_HTML_BYTES, _LOGIN_HTML_ETAG)
@@ -1,48 +1,118 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, date
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 import copy
 import json
+import os
+import tempfile
+import threading
 
-from .config import EVENTS_DATA_FILE, SEOUL, MAX_RECURRENCE_EXPANSION_DAYS, RECURRENCE_OCCURRENCE_SCALE
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # type: ignore
+
+from .config import EVENTS_DATA_FILE, EVENTS_SAVE_DEBOUNCE_SECONDS, SEOUL, MAX_RECURRENCE_EXPANSION_DAYS, RECURRENCE_OCCURRENCE_SCALE
 from .models import Event
 from .utils import _log_debug, _now_iso_minute, _event_within_scope, _normalize_exception_date
-from .recurrence import _normalize_recurrence_dict, _expand_recurring_item
+from .recurrence import _normalize_recurrence_dict, _iter_recurring_item
 
 # 메모리 저장
 # NOTE: 상태 변경은 이 모듈 내 함수에서 처리한다.
 events: List[Event] = []
 recurring_events: List[Dict[str, Any]] = []
 next_id: int = 1
+# id 조회용 인덱스. events/recurring_events를 바꾸는 곳에서 함께 갱신한다.
+_events_by_id: Dict[int, Event] = {}
+_recurring_by_id: Dict[int, Dict[str, Any]] = {}
+# events/recurring_events/인덱스 변경과 저장용 스냅샷을 직렬화한다. 저장은 Timer 스레드에서 돌기 때문이다.
+_state_lock = threading.RLock()
+_save_lock = threading.Lock()
+# 스냅샷부터 파일 교체까지를 한 번에 하나만 수행해, 늦게 뜬 스냅샷이 항상 마지막에 기록되게 한다.
+_write_lock = threading.Lock()
+_save_timer: Optional[threading.Timer] = None
+
+
+def _rebuild_event_indexes() -> None:
+    _events_by_id.clear()
+    _events_by_id.update((ev.id, ev) for ev in events)
+    _recurring_by_id.clear()
+    _recurring_by_id.update((item["id"], item) for item in recurring_events)
 
 
 def _serialize_events_payload() -> Dict[str, Any]:
-    return {
-        "version": 2,
-        "events": [e.dict() for e in events],
-        "recurring_events": recurring_events,
-    }
+    with _state_lock:
+        return {
+            "version": 2,
+            "events": [e.dict() for e in events],
+            "recurring_events": copy.deepcopy(recurring_events),
+        }
 
 
 def _save_events_to_disk() -> None:
-    try:
-        payload = _serialize_events_payload()
-        EVENTS_DATA_FILE.write_text(json.dumps(payload, ensure_ascii=False, indent=2),
-                                    encoding="utf-8")
-    except Exception as exc:
-        _log_debug(f"[EVENT STORE] save failed: {exc}")
+    with _write_lock:
+        tmp_name: Optional[str] = None
+        try:
+            payload = _serialize_events_payload()
+            if orjson is not None:
+                data = orjson.dumps(payload,
+                                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            else:
+                data = json.dumps(payload, ensure_ascii=False, indent=2).encode("utf-8")
+            # 쓰는 도중 프로세스가 죽어도 저장 파일이 깨지지 않도록 같은 디렉터리의 임시 파일에 쓰고 교체한다.
+            with tempfile.NamedTemporaryFile(dir=EVENTS_DATA_FILE.parent,
+                                             prefix=EVENTS_DATA_FILE.name + ".",
+                                             suffix=".tmp",
+                                             delete=False) as tmp:
+                tmp_name = tmp.name
+                tmp.write(data)
+            os.replace(tmp_name, EVENTS_DATA_FILE)
+        except Exception as exc:
+            _log_debug(f"[EVENT STORE] save failed: {exc}")
+            if tmp_name is not None:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+
+def _schedule_save_events() -> None:
+    """변경을 EVENTS_SAVE_DEBOUNCE_SECONDS 동안 모았다가 백그라운드 스레드에서 한 번에 저장한다."""
+    global _save_timer
+    if EVENTS_SAVE_DEBOUNCE_SECONDS <= 0:
+        _save_events_to_disk()
+        return
+    with _save_lock:
+        if _save_timer is not None:
+            return
+        _save_timer = threading.Timer(EVENTS_SAVE_DEBOUNCE_SECONDS, flush_events_to_disk)
+        _save_timer.daemon = True
+        _save_timer.start()
+
+
+def flush_events_to_disk() -> None:
+    """예약된 저장이 있으면 지금 바로 쓴다. 종료 훅에서도 호출한다."""
+    global _save_timer
+    with _save_lock:
+        timer, _save_timer = _save_timer, None
+    if timer is None:
+        return
+    timer.cancel()
+    _save_events_to_disk()
 
 
 def _load_events_from_disk() -> None:
     global events, recurring_events, next_id
     events.clear()
     recurring_events.clear()
+    _rebuild_event_indexes()
     next_id = 1
     if not EVENTS_DATA_FILE.exists():
         return
     try:
-        data = json.loads(EVENTS_DATA_FILE.read_text(encoding="utf-8"))
+        raw = EVENTS_DATA_FILE.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
     except Exception as exc:
         _log_debug(f"[EVENT STORE] load failed: {exc}")
         return
@@ -118,6 +188,7 @@ def _load_events_from_disk() -> None:
                 max_id = ev.id
         events[:] = loaded
 
+    _rebuild_event_indexes()
     next_id = max_id + 1 if max_id else 1
 
 
@@ -141,28 +212,30 @@ def store_event(
 ) -> Event:
     global next_id, events
     created_str = created_at or _now_iso_minute()
-    new_event = Event(
-        id=next_id,
-        title=title,
-        start=start,
-        end=end,
-        location=location,
-        description=description,
-        attendees=attendees,
-        reminders=reminders,
-        visibility=visibility,
-        transparency=transparency,
-        meeting_url=meeting_url,
-        color_id=color_id,
-        recur=recur,
-        google_event_id=google_event_id,
-        all_day=bool(all_day),
-        created_at=created_str,
-        timezone=timezone_value or "Asia/Seoul",
-    )
-    next_id += 1
-    events.append(new_event)
-    _save_events_to_disk()
+    with _state_lock:
+        new_event = Event(
+            id=next_id,
+            title=title,
+            start=start,
+            end=end,
+            location=location,
+            description=description,
+            attendees=attendees,
+            reminders=reminders,
+            visibility=visibility,
+            transparency=transparency,
+            meeting_url=meeting_url,
+            color_id=color_id,
+            recur=recur,
+            google_event_id=google_event_id,
+            all_day=bool(all_day),
+            created_at=created_str,
+            timezone=timezone_value or "Asia/Seoul",
+        )
+        next_id += 1
+        events.append(new_event)
+        _events_by_id[new_event.id] = new_event
+    _schedule_save_events()
     return new_event
 
 
@@ -204,28 +277,28 @@ def store_recurring_event(title: str,
         "google_event_id": google_event_id,
         "created_at": _now_iso_minute(),
     }
-    recurring_events.append(record)
-    next_id += 1
-    _save_events_to_disk()
+    with _state_lock:
+        record["id"] = next_id
+        next_id += 1
+        recurring_events.append(record)
+        _recurring_by_id[record["id"]] = record
+    _schedule_save_events()
     return record
 
 
 def _find_recurring_event(event_id: int) -> Optional[Dict[str, Any]]:
-    for item in recurring_events:
-        if item.get("id") == event_id:
-            return item
-    return None
+    return _recurring_by_id.get(event_id)
 
 
 def _delete_recurring_event(event_id: int, persist: bool = True) -> bool:
     global recurring_events
-    before = len(recurring_events)
-    recurring_events = [item for item in recurring_events if item.get("id") != event_id]
-    if len(recurring_events) < before:
-        if persist:
-            _save_events_to_disk()
-        return True
-    return False
+    with _state_lock:
+        if _recurring_by_id.pop(event_id, None) is None:
+            return False
+        recurring_events = [item for item in recurring_events if item.get("id") != event_id]
+    if persist:
+        _schedule_save_events()
+    return True
 
 
 def _recurring_definition_to_event(rec: Dict[str, Any]) -> Event:
@@ -311,7 +384,11 @@ def _decode_occurrence_id(value: int) -> Optional[int]:
 
 def _collect_local_recurring_occurrences(
         scope: Optional[Tuple[date, date]] = None) -> List[Event]:
-    items: List[Event] = []
+    return list(_iter_local_recurring_occurrences(scope=scope))
+
+
+def _iter_local_recurring_occurrences(
+        scope: Optional[Tuple[date, date]] = None) -> Iterator[Event]:
     for rec in recurring_events:
         recurrence_spec = rec.get("recurrence")
         if not isinstance(recurrence_spec, dict):
@@ -326,11 +403,9 @@ def _collect_local_recurring_occurrences(
             "exceptions": rec.get("exceptions"),
             "timezone": rec.get("timezone"),
         }
-        expanded = _expand_recurring_item(base_dict, scope=scope)
-        for idx, occ in enumerate(expanded):
+        for idx, occ in enumerate(_iter_recurring_item(base_dict, scope=scope)):
             occurrence_id = -(rec["id"] * RECURRENCE_OCCURRENCE_SCALE + idx + 1)
-            items.append(_build_recurring_occurrence_event(rec, occ, occurrence_id))
-    return items
+            yield _build_recurring_occurrence_event(rec, occ, occurrence_id)
 
 
 def _list_local_events_for_api(
@@ -368,22 +443,20 @@ def delete_events_by_ids(ids: List[int]) -> List[int]:
             normalized_ids.append(raw)
 
     id_set = set(normalized_ids)
-    deleted: List[int] = []
-
-    remaining: List[Event] = []
-    for ev in events:
-        if ev.id in id_set:
-            deleted.append(ev.id)
-        else:
-            remaining.append(ev)
-    events = remaining
-
-    for raw_id in list(id_set):
-        if raw_id in deleted:
-            continue
-        if _delete_recurring_event(raw_id, persist=False):
-            deleted.append(raw_id)
+    with _state_lock:
+        deleted_single = id_set & _events_by_id.keys()
+        if deleted_single:
+            events = [ev for ev in events if ev.id not in deleted_single]
+            for event_id in deleted_single:
+                del _events_by_id[event_id]
+        deleted: List[int] = list(deleted_single)
+
+        # 단일 일정에서 못 찾은 id만 반복 일정에서 찾는다.
+        for raw_id in id_set - deleted_single:
+            if _delete_recurring_event(raw_id, persist=False):
+                deleted.append(raw_id)
 
     if deleted:
-        _save_events_to_disk()
-    return sorted(deleted)
+        _schedule_save_events()
+        deleted.sort()
+    return deleted
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, tzinfo
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 import re
 
@@ -9,8 +10,6 @@ from fastapi import HTTPException
 from .config import (
     LLM_DEBUG,
     SEOUL,
-    ISO_DATETIME_RE,
-    ISO_DATE_RE,
     ISO_DATETIME_24_RE,
     DATETIME_FLEX_RE,
     MAX_SCOPE_DAYS,
@@ -20,15 +19,44 @@ from .config import (
 )
 
 
-def _log_debug(message: str) -> None:
+def _log_debug(message: str, *args: Any) -> None:
+    """LLM_DEBUG일 때만 출력한다. args가 있으면 출력 직전에 % 포맷한다."""
     if LLM_DEBUG:
-        print(message, flush=True)
+        print(message % args if args else message, flush=True)
 
 
 def _now_iso_minute() -> str:
     return datetime.now(SEOUL).strftime("%Y-%m-%dT%H:%M")
 
 
+def _is_iso_date(value: str) -> bool:
+    """ISO_DATE_RE(YYYY-MM-DD)와 같은 검사를 정규식 호출 없이 한다. 끝의 개행도 허용하지 않는다."""
+    return (len(value) == 10 and value[4] == "-" and value[7] == "-"
+            and value.isascii() and value[:4].isdigit()
+            and value[5:7].isdigit() and value[8:].isdigit())
+
+
+def _is_iso_datetime(value: str) -> bool:
+    """ISO_DATETIME_RE(YYYY-MM-DDTHH:MM)와 같은 검사를 정규식 호출 없이 한다."""
+    return (len(value) == 16 and value[10] == "T" and value[13] == ":"
+            and value.isascii() and _is_iso_date(value[:10])
+            and value[11:13].isdigit() and value[14:].isdigit())
+
+
+def _parse_iso_minute(value: str, tz: Optional[tzinfo] = None) -> datetime:
+    """'YYYY-MM-DDTHH:MM' 문자열을 strptime 없이 슬라이싱으로 파싱한다."""
+    if len(value) != 16 or value[4] != "-" or value[7] != "-" or value[10] != "T" \
+            or value[13] != ":":
+        raise ValueError(f"invalid ISO minute: {value!r}")
+    return datetime(int(value[0:4]), int(value[5:7]), int(value[8:10]),
+                    int(value[11:13]), int(value[14:16]), tzinfo=tz)
+
+
+def _format_iso_minute(dt: datetime) -> str:
+    return (f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}"
+            f"T{dt.hour:02d}:{dt.minute:02d}")
+
+
 def normalize_text(text: str) -> str:
     t = (text or "").strip()
     t = re.sub(r"\s+", " ", t)
@@ -68,9 +96,9 @@ def _normalize_exception_date(value: Any) -> Optional[str]:
     raw = value.strip()
     if not raw:
         return None
-    if ISO_DATE_RE.match(raw):
+    if _is_iso_date(raw):
         return raw
-    if ISO_DATETIME_RE.match(raw) or ISO_DATETIME_24_RE.match(raw):
+    if _is_iso_datetime(raw) or ISO_DATETIME_24_RE.fullmatch(raw):
         return raw[:10]
     normalized = _normalize_datetime_minute(raw)
     if normalized:
@@ -84,9 +112,9 @@ def _normalize_end_datetime(raw_end: Any) -> Optional[str]:
     candidate = raw_end.strip()
     if not candidate:
         return None
-    if ISO_DATETIME_RE.match(candidate):
+    if _is_iso_datetime(candidate):
         return candidate
-    if ISO_DATETIME_24_RE.match(candidate):
+    if ISO_DATETIME_24_RE.fullmatch(candidate):
         base = candidate[:10]
         try:
             base_date = datetime.strptime(base, "%Y-%m-%d").date()
@@ -94,7 +122,7 @@ def _normalize_end_datetime(raw_end: Any) -> Optional[str]:
             return None
         next_day = base_date + timedelta(days=1)
         return next_day.strftime("%Y-%m-%dT00:00")
-    if ISO_DATE_RE.match(candidate):
+    if _is_iso_date(candidate):
         try:
             base_date = datetime.strptime(candidate, "%Y-%m-%d").date()
             next_day = base_date + timedelta(days=1)
@@ -111,11 +139,11 @@ def _normalize_datetime_minute(raw: str) -> Optional[str]:
     candidate = raw.strip()
     if not candidate:
         return None
-    if ISO_DATETIME_RE.match(candidate):
+    if _is_iso_datetime(candidate):
         return candidate
     if candidate.endswith("Z"):
         candidate = candidate[:-1] + "+00:00"
-    match = DATETIME_FLEX_RE.match(candidate)
+    match = DATETIME_FLEX_RE.fullmatch(candidate)
     if match:
         return f"{match.group(1)}T{match.group(2)}"
     try:
@@ -221,7 +249,7 @@ def _normalize_single_event_times(
 
     if isinstance(start_raw, str):
         s = start_raw.strip()
-        if ISO_DATE_RE.match(s):
+        if _is_iso_date(s):
             start_iso = s + "T00:00"
         else:
             start_iso = _normalize_datetime_minute(s)
@@ -242,9 +270,9 @@ def _coerce_patch_start(value: Any) -> Optional[str]:
     candidate = value.strip()
     if not candidate:
         return None
-    if ISO_DATE_RE.match(candidate):
+    if _is_iso_date(candidate):
         return candidate + "T00:00"
-    if not ISO_DATETIME_RE.match(candidate):
+    if not _is_iso_datetime(candidate):
         raise HTTPException(status_code=400, detail="시작 시각 형식이 잘못되었습니다.")
     return candidate
 
@@ -335,19 +363,45 @@ def _merge_description(description: Optional[str],
     return f"회의 링크: {link}"
 
 
+def _memo_on_tuple(cached_fn, uncached_fn, values: List[Any]):
+    """리스트 입력을 튜플로 바꿔 캐시를 타고, 해시가 안 되는 원소가 있으면 그냥 계산한다."""
+    try:
+        return cached_fn(tuple(values))
+    except TypeError:
+        return uncached_fn(values)
+
+
+def _clean_attendee_emails(attendees) -> Tuple[str, ...]:
+    return tuple(
+        email for item in attendees
+        if isinstance(item, str) and (email := item.strip())
+    )
+
+
+def _clean_reminder_minutes(reminders) -> Tuple[int, ...]:
+    cleaned: List[int] = []
+    for raw in reminders:
+        try:
+            minutes = int(raw)
+        except Exception:
+            continue
+        if minutes >= 0:
+            cleaned.append(minutes)
+    return tuple(cleaned)
+
+
+_cached_attendee_emails = lru_cache(maxsize=1024)(_clean_attendee_emails)
+_cached_reminder_minutes = lru_cache(maxsize=1024)(_clean_reminder_minutes)
+
+
 def _build_gcal_attendees(attendees: Optional[List[str]]) -> Optional[List[Dict[str, str]]]:
     if attendees is None:
         return None
     if len(attendees) == 0:
         return []
-    results: List[Dict[str, str]] = []
-    for item in attendees:
-        if not isinstance(item, str):
-            continue
-        email = item.strip()
-        if email:
-            results.append({"email": email})
-    return results or None
+    emails = _memo_on_tuple(_cached_attendee_emails, _clean_attendee_emails, attendees)
+    # 반환값은 요청 body에 그대로 들어가므로 매번 새 dict로 만든다.
+    return [{"email": email} for email in emails] or None
 
 
 def _build_gcal_reminders(reminders: Optional[List[int]]) -> Optional[Dict[str, Any]]:
@@ -355,18 +409,13 @@ def _build_gcal_reminders(reminders: Optional[List[int]]) -> Optional[Dict[str,
         return None
     if not reminders:
         return {"useDefault": True}
-    overrides: List[Dict[str, Any]] = []
-    for raw in reminders:
-        try:
-            minutes = int(raw)
-        except Exception:
-            continue
-        if minutes < 0:
-            continue
-        overrides.append({"method": "popup", "minutes": minutes})
-    if not overrides:
+    minutes_list = _memo_on_tuple(_cached_reminder_minutes, _clean_reminder_minutes, reminders)
+    if not minutes_list:
         return {"useDefault": True}
-    return {"useDefault": False, "overrides": overrides}
+    return {
+        "useDefault": False,
+        "overrides": [{"method": "popup", "minutes": minutes} for minutes in minutes_list],
+    }
 
 
 def _normalize_visibility(value: Optional[str]) -> Optional[str]:
@@ -382,14 +431,17 @@ def _normalize_transparency(value: Optional[str]) -> Optional[str]:
 
 
 def _normalize_color_id(value: Optional[str]) -> Optional[str]:
-    if value is None:
+    if not isinstance(value, str):
         return None
-    if isinstance(value, str):
-        cleaned = value.strip()
-        if cleaned.isdigit():
-            number = int(cleaned)
-            if 1 <= number <= 11:
-                return str(number)
-        if cleaned == "":
-            return None
+    return _normalize_color_id_text(value)
+
+
+@lru_cache(maxsize=64)
+def _normalize_color_id_text(value: str) -> Optional[str]:
+    # Google 일정 색상은 "1"~"11"뿐이라 입력 문자열 종류도 적다.
+    cleaned = value.strip()
+    if cleaned.isdigit():
+        number = int(cleaned)
+        if 1 <= number <= 11:
+            return str(number)
     return None
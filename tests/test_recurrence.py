@@ -0,0 +1,29 @@
+from datetime import date
+
+from backend.recurrence import _iter_recurring_item
+
+
+def _monthly_count_item(count: int) -> dict:
+    return {
+        "title": "월간 회의",
+        "start_date": "2026-01-15",
+        "time": "10:00",
+        "duration_minutes": 60,
+        "recurrence": {"freq": "MONTHLY", "interval": 1, "end": {"count": count}},
+    }
+
+
+def test_count_rule_outside_scope_yields_nothing():
+    # 1/15부터 9회면 9/15가 마지막이라 10월 이후 scope에는 발생일이 없다.
+    scope = (date(2026, 10, 26), date(2027, 4, 26))
+    assert list(_iter_recurring_item(_monthly_count_item(9), scope=scope)) == []
+
+
+def test_count_rule_is_clipped_to_scope():
+    scope = (date(2026, 3, 1), date(2026, 5, 31))
+    starts = [occ["start"] for occ in _iter_recurring_item(_monthly_count_item(9), scope=scope)]
+    assert starts == ["2026-03-15T10:00", "2026-04-15T10:00", "2026-05-15T10:00"]
+
+
+def test_count_rule_without_scope_keeps_all_occurrences():
+    assert len(list(_iter_recurring_item(_monthly_count_item(9)))) == 9